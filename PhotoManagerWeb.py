@@ -10,18 +10,30 @@ Version: 3.0 (Web Edition)
 """
 
 import os
+import errno
+import stat
+import re
 import sys
 import json
 import socket
+import gzip
+import hashlib
 import shutil
 import threading
+import time
 import webbrowser
 import logging
 import traceback
+import uuid
+import queue
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
 from pathlib import Path
-from datetime import datetime
+from urllib.parse import urlsplit
 from typing import Optional
-from flask import Flask, render_template_string, jsonify, request, send_from_directory
+from flask import Flask, Response, abort, jsonify, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 
 # Set up logging
 logging.basicConfig(
@@ -34,6 +46,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Brotli is optional; pages fall back to gzip when it is missing
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# orjson is optional; JSON responses fall back to the standard library
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# waitress is optional; without it the app runs on Flask's built-in server
+try:
+    from waitress import serve as waitress_serve
+    HAS_WAITRESS = True
+except ImportError:
+    HAS_WAITRESS = False
+
 # Try to import PhotoProcessor, but allow running without it for UI testing
 try:
     from PhotoProcessor import PhotoProcessor, ProcessingIssue
@@ -44,7 +77,29 @@ except ImportError:
     logger.warning("PhotoProcessor not found. Running in UI-only mode.")
     print("Warning: PhotoProcessor not found. Running in UI-only mode.")
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that parses and serializes with orjson
+
+    Installed as app.json when orjson is available, so request.json and
+    jsonify() use it without any change at the call sites.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys'):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if HAS_ORJSON:
+    app.json = OrjsonProvider(app)
 
 # =============================================================================
 # Configuration
@@ -56,23 +111,86 @@ DEFAULT_SETTINGS = {
     "exiftool_path": "exiftool"
 }
 
+# Photo types shown in the review UI (matched case-insensitively)
+PHOTO_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.heic', '.gif', '.webp'})
+
+# Prefix PhotoProcessor gives the suggested keeper in each review group
+BEST_PREFIX = 'BEST_'
+
+# Number of log lines kept for the UI
+LOG_MAX_LINES = 100
+
 # Global state
 processing_status = {
     "is_processing": False,
     "progress": 0,
     "status": "Ready",
-    "log": []
+    "log": deque(maxlen=LOG_MAX_LINES),
+    "log_seq": 0,    # Number of log lines ever added; never reset
+    "log_start": 0   # log_seq when the current run's log was started
 }
 
+# Guards processing_status["log"]; a deque cannot be copied while another thread appends
+log_lock = threading.Lock()
+
+# Set when the server stops so background work can stop waiting
+shutdown_event = threading.Event()
+
+# Request threads when running under waitress; each open status stream holds one
+SERVER_THREADS = 16
+
+# Shared pool for short background work (e.g. deleting reviewed groups) so
+# requests never spawn threads of their own. Processing runs are not submitted
+# here: a pool worker would keep the server from exiting until a run finished.
+BACKGROUND_WORKERS = min(4, os.cpu_count() or 2)
+_background_pool = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix='background')
+
+# Notified whenever processing_status changes; status streams wait on it
+status_changed = threading.Condition()
+
+# An idle status stream sends a comment this often (seconds) so proxies keep it
+# open and a closed tab's stream notices and ends
+STATUS_HEARTBEAT_SECONDS = 15
+
+# Time between simulated steps in demo mode (seconds)
+DEMO_STEP_SECONDS = 2
+
+# How far a processing run steps back so /api/status stays responsive
+WORKER_NICENESS = 5
+THREAD_PRIORITY_BELOW_NORMAL = -1
+
+
+# Parsed config file, keyed on (path, mtime_ns, size) so edits on disk are picked up
+_settings_cache = {"key": None, "data": None}
+_settings_lock = threading.Lock()
+
+
+def _settings_file_key(st):
+    return (str(CONFIG_FILE), st.st_mtime_ns, st.st_size)
+
 
 def load_settings():
-    """Load settings from config file with error handling"""
-    if CONFIG_FILE.exists():
+    """Load settings from config file with error handling
+
+    The file is only re-read when it changes; callers get their own copy.
+    """
+    try:
+        key = _settings_file_key(os.stat(CONFIG_FILE))
+    except OSError:
+        key = None
+    if key is not None:
+        with _settings_lock:
+            if _settings_cache["key"] == key:
+                return dict(_settings_cache["data"])
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                settings = json.load(f)
-                logger.info(f"Loaded settings from {CONFIG_FILE}")
-                return settings
+            with open(CONFIG_FILE, 'rb') as f:
+                key = _settings_file_key(os.fstat(f.fileno()))
+                settings = json_loads(f.read())
+            logger.info(f"Loaded settings from {CONFIG_FILE}")
+            with _settings_lock:
+                _settings_cache["key"] = key
+                _settings_cache["data"] = settings
+            return dict(settings)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in config file: {e}")
             add_log(f"ERROR: Invalid config file format: {e}")
@@ -85,10 +203,26 @@ def load_settings():
 
 
 def save_settings(settings):
-    """Save settings to config file with error handling"""
+    """Save settings to config file with error handling
+
+    The file is written beside config.json and renamed over it, so a crash
+    mid-write never leaves a truncated config behind.
+    """
+    tmp_file = CONFIG_FILE.with_name(f'.{CONFIG_FILE.name}.{uuid.uuid4().hex}.tmp')
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(json_bytes(settings, indent=True))
+            os.replace(tmp_file, CONFIG_FILE)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+        with _settings_lock:
+            _settings_cache["key"] = _settings_file_key(os.stat(CONFIG_FILE))
+            _settings_cache["data"] = dict(settings)
         logger.info(f"Saved settings to {CONFIG_FILE}")
         return True
     except PermissionError as e:
@@ -101,8 +235,12 @@ def save_settings(settings):
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
-    """Get local IP address for network access"""
+    """Get local IP address for network access
+
+    Looked up once per process; call get_local_ip.cache_clear() to refresh.
+    """
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
@@ -113,747 +251,185 @@ def get_local_ip():
         return "127.0.0.1"
 
 
+def json_bytes(obj, indent=False):
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed
+
+    indent=True gives the two-space layout used for config.json.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def fast_json(obj, status=200):
+    """Build a JSON response without going through Flask's jsonify"""
+    return Response(json_bytes(obj), status=status, mimetype='application/json')
+
+
+# "HH:MM:SS" for the current second; only reformatted when the second changes
+_log_clock = {"second": None, "text": ""}
+
+
+def log_timestamp():
+    """Return the log timestamp for now; call with log_lock held"""
+    second = int(time.time())
+    if second != _log_clock["second"]:
+        _log_clock["second"] = second
+        _log_clock["text"] = time.strftime("%H:%M:%S", time.localtime(second))
+    return _log_clock["text"]
+
+
 def add_log(message):
     """Add message to processing log"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    processing_status["log"].append(f"[{timestamp}] {message}")
-    # Keep only last 100 messages
-    if len(processing_status["log"]) > 100:
-        processing_status["log"] = processing_status["log"][-100:]
+    with log_lock:
+        # The deque drops the oldest line once LOG_MAX_LINES is reached
+        processing_status["log"].append(f"[{log_timestamp()}] {message}")
+        processing_status["log_seq"] += 1
+    notify_status()
+
+
+def clear_log():
+    """Start a fresh log for a new run; clients reset their view when log_start moves"""
+    with log_lock:
+        processing_status["log"].clear()
+        processing_status["log_start"] = processing_status["log_seq"]
+    notify_status()
+
+
+def notify_status():
+    """Wake every status stream so it can push the change"""
+    with status_changed:
+        status_changed.notify_all()
+
+
+def update_status_fields(**changes):
+    """Update processing_status fields (progress, status, ...) and notify streams"""
+    with status_changed:
+        processing_status.update(changes)
+        status_changed.notify_all()
 
 
 # =============================================================================
 # HTML Template - Mobile-First Material Design
 # =============================================================================
 
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=no">
-    <meta name="apple-mobile-web-app-capable" content="yes">
-    <meta name="mobile-web-app-capable" content="yes">
-    <meta name="theme-color" content="#1a1a2e">
-    <title>Google Photos Manager</title>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <link href="https://fonts.googleapis.com/icon?family=Material+Icons+Round" rel="stylesheet">
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-            -webkit-tap-highlight-color: transparent;
-        }
-
-        body {
-            font-family: 'Poppins', sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            min-height: 100vh;
-            color: #fff;
-            padding: 20px;
-            padding-bottom: 100px;
-        }
-
-        .container {
-            max-width: 500px;
-            margin: 0 auto;
-        }
-
-        /* Header */
-        .header {
-            text-align: center;
-            padding: 30px 0;
-        }
-
-        .header-icon {
-            font-size: 64px;
-            color: #e94560;
-            margin-bottom: 10px;
-        }
-
-        .header h1 {
-            font-size: 24px;
-            font-weight: 700;
-            margin-bottom: 5px;
-            background: linear-gradient(90deg, #e94560, #0f3460);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-
-        .header p {
-            font-size: 14px;
-            color: #a0a0a0;
-        }
-
-        /* Cards */
-        .card {
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 20px;
-            padding: 25px;
-            margin-bottom: 20px;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .card-title {
-            font-size: 18px;
-            font-weight: 600;
-            margin-bottom: 20px;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-
-        .card-title .material-icons-round {
-            color: #e94560;
-        }
-
-        /* Quick Start Steps */
-        .steps {
-            counter-reset: step;
-        }
-
-        .step {
-            display: flex;
-            gap: 15px;
-            margin-bottom: 20px;
-            align-items: flex-start;
-        }
-
-        .step-number {
-            width: 36px;
-            height: 36px;
-            background: linear-gradient(135deg, #e94560, #0f3460);
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 700;
-            font-size: 16px;
-            flex-shrink: 0;
-        }
-
-        .step-content h3 {
-            font-size: 15px;
-            font-weight: 600;
-            margin-bottom: 5px;
-        }
-
-        .step-content p {
-            font-size: 13px;
-            color: #a0a0a0;
-            line-height: 1.5;
-        }
-
-        /* Buttons */
-        .btn {
-            width: 100%;
-            padding: 18px 24px;
-            border: none;
-            border-radius: 15px;
-            font-family: 'Poppins', sans-serif;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 10px;
-            transition: all 0.3s ease;
-            margin-bottom: 12px;
-        }
-
-        .btn-primary {
-            background: linear-gradient(135deg, #e94560, #0f3460);
-            color: white;
-            box-shadow: 0 10px 30px rgba(233, 69, 96, 0.3);
-        }
-
-        .btn-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 15px 40px rgba(233, 69, 96, 0.4);
-        }
-
-        .btn-primary:active {
-            transform: translateY(0);
-        }
-
-        .btn-primary:disabled {
-            background: #3a3a5a;
-            box-shadow: none;
-            cursor: not-allowed;
-        }
-
-        .btn-secondary {
-            background: rgba(255, 255, 255, 0.1);
-            color: white;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }
-
-        .btn-secondary:hover {
-            background: rgba(255, 255, 255, 0.15);
-        }
-
-        .btn-success {
-            background: linear-gradient(135deg, #4CAF50, #2E7D32);
-            color: white;
-        }
-
-        .btn-warning {
-            background: linear-gradient(135deg, #FF9800, #F57C00);
-            color: white;
-        }
-
-        /* Progress */
-        .progress-container {
-            margin: 20px 0;
-        }
-
-        .progress-bar {
-            height: 8px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 4px;
-            overflow: hidden;
-            margin-bottom: 10px;
-        }
-
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #e94560, #0f3460);
-            border-radius: 4px;
-            transition: width 0.3s ease;
-            width: 0%;
-        }
-
-        .progress-text {
-            font-size: 13px;
-            color: #a0a0a0;
-            text-align: center;
-        }
-
-        /* Status Badge */
-        .status-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 8px;
-            padding: 8px 16px;
-            background: rgba(76, 175, 80, 0.2);
-            border-radius: 20px;
-            font-size: 13px;
-            color: #4CAF50;
-            margin-bottom: 15px;
-        }
-
-        .status-badge.processing {
-            background: rgba(233, 69, 96, 0.2);
-            color: #e94560;
-        }
-
-        .status-badge .dot {
-            width: 8px;
-            height: 8px;
-            background: currentColor;
-            border-radius: 50%;
-        }
-
-        .status-badge.processing .dot {
-            animation: pulse 1.5s infinite;
-        }
-
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.3; }
-        }
-
-        /* Log */
-        .log-container {
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 12px;
-            padding: 15px;
-            max-height: 200px;
-            overflow-y: auto;
-            font-family: 'Courier New', monospace;
-            font-size: 11px;
-            line-height: 1.6;
-            color: #a0a0a0;
-        }
-
-        .log-container::-webkit-scrollbar {
-            width: 6px;
-        }
-
-        .log-container::-webkit-scrollbar-thumb {
-            background: rgba(255, 255, 255, 0.2);
-            border-radius: 3px;
-        }
-
-        /* Settings Form */
-        .form-group {
-            margin-bottom: 20px;
-        }
-
-        .form-group label {
-            display: block;
-            font-size: 13px;
-            font-weight: 500;
-            margin-bottom: 8px;
-            color: #a0a0a0;
-        }
-
-        .form-group input {
-            width: 100%;
-            padding: 15px;
-            background: rgba(0, 0, 0, 0.3);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            color: white;
-            font-family: 'Poppins', sans-serif;
-            font-size: 14px;
-        }
-
-        .form-group input:focus {
-            outline: none;
-            border-color: #e94560;
-        }
-
-        /* Tabs */
-        .tabs {
-            display: flex;
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 15px;
-            padding: 5px;
-            margin-bottom: 20px;
-        }
-
-        .tab {
-            flex: 1;
-            padding: 12px;
-            text-align: center;
-            border-radius: 12px;
-            cursor: pointer;
-            font-size: 13px;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }
-
-        .tab.active {
-            background: linear-gradient(135deg, #e94560, #0f3460);
-        }
-
-        .tab-content {
-            display: none;
-        }
-
-        .tab-content.active {
-            display: block;
-        }
-
-        /* Emoji Icons for Wife-Friendliness */
-        .emoji-icon {
-            font-size: 24px;
-            margin-right: 5px;
-        }
-
-        /* Network Info */
-        .network-info {
-            text-align: center;
-            padding: 15px;
-            background: rgba(76, 175, 80, 0.1);
-            border-radius: 12px;
-            margin-top: 20px;
-        }
-
-        .network-info p {
-            font-size: 12px;
-            color: #a0a0a0;
-            margin-bottom: 5px;
-        }
-
-        .network-info .url {
-            font-size: 14px;
-            font-weight: 600;
-            color: #4CAF50;
-            word-break: break-all;
-        }
-
-        /* Hide sections */
-        .hidden {
-            display: none !important;
-        }
-
-        /* Toast Notification */
-        .toast {
-            position: fixed;
-            bottom: 30px;
-            left: 50%;
-            transform: translateX(-50%) translateY(100px);
-            background: #333;
-            color: white;
-            padding: 15px 25px;
-            border-radius: 12px;
-            font-size: 14px;
-            opacity: 0;
-            transition: all 0.3s ease;
-            z-index: 1000;
-        }
-
-        .toast.show {
-            transform: translateX(-50%) translateY(0);
-            opacity: 1;
-        }
-
-        /* Help Tips */
-        .tip {
-            display: flex;
-            gap: 12px;
-            padding: 15px;
-            background: rgba(233, 69, 96, 0.1);
-            border-radius: 12px;
-            margin-bottom: 15px;
-            border-left: 3px solid #e94560;
-        }
-
-        .tip-icon {
-            font-size: 20px;
-        }
-
-        .tip-text {
-            font-size: 13px;
-            line-height: 1.5;
-            color: #e0e0e0;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <!-- Header -->
-        <div class="header">
-            <div class="header-icon">
-                <span class="material-icons-round">photo_library</span>
-            </div>
-            <h1>Google Photos Manager</h1>
-            <p>Organize your photos easily!</p>
-        </div>
-
-        <!-- Tabs -->
-        <div class="tabs">
-            <div class="tab active" onclick="showTab('home')">
-                <span class="material-icons-round">home</span>
-            </div>
-            <div class="tab" onclick="showTab('guide')">
-                <span class="material-icons-round">help</span>
-            </div>
-            <div class="tab" onclick="showTab('settings')">
-                <span class="material-icons-round">settings</span>
-            </div>
-        </div>
-
-        <!-- Home Tab -->
-        <div id="tab-home" class="tab-content active">
-            <!-- Status Card -->
-            <div class="card">
-                <div class="card-title">
-                    <span class="material-icons-round">info</span>
-                    Status
-                </div>
-
-                <div id="status-badge" class="status-badge">
-                    <span class="dot"></span>
-                    <span id="status-text">Ready to go!</span>
-                </div>
-
-                <div id="progress-section" class="progress-container hidden">
-                    <div class="progress-bar">
-                        <div id="progress-fill" class="progress-fill"></div>
-                    </div>
-                    <div id="progress-text" class="progress-text">Processing...</div>
-                </div>
-            </div>
-
-            <!-- Action Card -->
-            <div class="card">
-                <div class="card-title">
-                    <span class="material-icons-round">bolt</span>
-                    What would you like to do?
-                </div>
-
-                <button id="btn-process" class="btn btn-primary" onclick="startProcessing()">
-                    <span class="material-icons-round">auto_fix_high</span>
-                    Organize My Photos
-                </button>
-
-                <button class="btn btn-warning" onclick="openReview()">
-                    <span class="material-icons-round">rate_review</span>
-                    Review Flagged Photos
-                </button>
-
-                <button class="btn btn-success" onclick="openLibrary()">
-                    <span class="material-icons-round">folder_open</span>
-                    Open My Photo Library
-                </button>
-            </div>
-
-            <!-- Activity Log -->
-            <div class="card">
-                <div class="card-title">
-                    <span class="material-icons-round">history</span>
-                    Activity Log
-                </div>
-                <div id="log-container" class="log-container">
-                    Welcome! Click "Organize My Photos" to start.
-                </div>
-            </div>
-        </div>
-
-        <!-- Guide Tab -->
-        <div id="tab-guide" class="tab-content">
-            <div class="card">
-                <div class="card-title">
-                    <span class="emoji-icon">📱</span>
-                    Quick Start Guide
-                </div>
-
-                <div class="tip">
-                    <span class="tip-icon">💡</span>
-                    <span class="tip-text">This guide will help you organize all your Google Photos in just a few easy steps!</span>
-                </div>
-
-                <div class="steps">
-                    <div class="step">
-                        <div class="step-number">1</div>
-                        <div class="step-content">
-                            <h3>Download Your Photos</h3>
-                            <p>Go to <strong>takeout.google.com</strong> on your computer. Select "Google Photos" and download the ZIP file.</p>
-                        </div>
-                    </div>
-
-                    <div class="step">
-                        <div class="step-number">2</div>
-                        <div class="step-content">
-                            <h3>Put the ZIP File Here</h3>
-                            <p>Move the downloaded ZIP file to:<br>
-                            <strong id="takeout-path">PhotoLibrary/GoogleTakeout/</strong></p>
-                        </div>
-                    </div>
-
-                    <div class="step">
-                        <div class="step-number">3</div>
-                        <div class="step-content">
-                            <h3>Click "Organize My Photos"</h3>
-                            <p>Press the big button and wait. The app will automatically sort everything by date!</p>
-                        </div>
-                    </div>
-
-                    <div class="step">
-                        <div class="step-number">4</div>
-                        <div class="step-content">
-                            <h3>Review (Optional)</h3>
-                            <p>Click "Review Flagged Photos" to see any duplicates or blurry photos the app found.</p>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="card">
-                <div class="card-title">
-                    <span class="emoji-icon">❓</span>
-                    Common Questions
-                </div>
-
-                <div class="tip">
-                    <span class="tip-icon">📁</span>
-                    <span class="tip-text"><strong>Where do my photos go?</strong><br>They're organized into "Photos & Videos" folder, sorted by year and month.</span>
-                </div>
-
-                <div class="tip">
-                    <span class="tip-icon">🗑️</span>
-                    <span class="tip-text"><strong>Will it delete my photos?</strong><br>Never! Photos are only moved and organized, never deleted.</span>
-                </div>
-
-                <div class="tip">
-                    <span class="tip-icon">📅</span>
-                    <span class="tip-text"><strong>How does it fix dates?</strong><br>Google includes date info in JSON files. We restore those dates to your photos!</span>
-                </div>
-            </div>
-        </div>
-
-        <!-- Settings Tab -->
-        <div id="tab-settings" class="tab-content">
-            <div class="card">
-                <div class="card-title">
-                    <span class="material-icons-round">folder</span>
-                    Photo Library Location
-                </div>
-
-                <div class="form-group">
-                    <label>Where are your photos stored?</label>
-                    <input type="text" id="base-path" placeholder="C:\\Users\\You\\PhotoLibrary">
-                </div>
-
-                <button class="btn btn-primary" onclick="saveSettings()">
-                    <span class="material-icons-round">save</span>
-                    Save Settings
-                </button>
-            </div>
-
-            <div class="card">
-                <div class="card-title">
-                    <span class="material-icons-round">wifi</span>
-                    Access from Your Phone
-                </div>
-
-                <div class="network-info">
-                    <p>Open this URL on your phone:</p>
-                    <div class="url" id="network-url">http://{{ local_ip }}:5000</div>
-                </div>
-
-                <div class="tip" style="margin-top: 15px;">
-                    <span class="tip-icon">📱</span>
-                    <span class="tip-text">Make sure your phone is on the same WiFi network as this computer!</span>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <div id="toast" class="toast"></div>
-
-    <script>
-        // Tab switching
-        function showTab(tabName) {
-            document.querySelectorAll('.tab-content').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            document.getElementById('tab-' + tabName).classList.add('active');
-            event.target.closest('.tab').classList.add('active');
-        }
-
-        // Toast notifications
-        function showToast(message) {
-            const toast = document.getElementById('toast');
-            toast.textContent = message;
-            toast.classList.add('show');
-            setTimeout(() => toast.classList.remove('show'), 3000);
-        }
-
-        // Load settings on page load
-        async function loadSettings() {
-            try {
-                const response = await fetch('/api/settings');
-                const settings = await response.json();
-                document.getElementById('base-path').value = settings.base_path || '';
-                document.getElementById('takeout-path').textContent = settings.base_path + '/GoogleTakeout/';
-            } catch (e) {
-                console.error('Failed to load settings:', e);
-            }
-        }
-
-        // Save settings
-        async function saveSettings() {
-            const basePath = document.getElementById('base-path').value;
-            try {
-                await fetch('/api/settings', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({base_path: basePath})
-                });
-                showToast('Settings saved! ✓');
-                document.getElementById('takeout-path').textContent = basePath + '/GoogleTakeout/';
-            } catch (e) {
-                showToast('Failed to save settings');
-            }
-        }
-
-        // Start processing
-        async function startProcessing() {
-            const btn = document.getElementById('btn-process');
-            if (btn.disabled) return;
-
-            if (!confirm('This will organize all photos in your GoogleTakeout folder.\\n\\nContinue?')) {
-                return;
-            }
-
-            btn.disabled = true;
-            document.getElementById('progress-section').classList.remove('hidden');
-            document.getElementById('status-badge').classList.add('processing');
-
-            try {
-                await fetch('/api/process', {method: 'POST'});
-                pollStatus();
-            } catch (e) {
-                showToast('Failed to start processing');
-                btn.disabled = false;
-            }
-        }
-
-        // Poll for status updates
-        async function pollStatus() {
-            try {
-                const response = await fetch('/api/status');
-                const status = await response.json();
-
-                document.getElementById('status-text').textContent = status.status;
-                document.getElementById('progress-fill').style.width = status.progress + '%';
-                document.getElementById('progress-text').textContent = status.status;
-                document.getElementById('log-container').innerHTML = status.log.join('<br>');
-
-                // Auto-scroll log
-                const logContainer = document.getElementById('log-container');
-                logContainer.scrollTop = logContainer.scrollHeight;
-
-                if (status.is_processing) {
-                    setTimeout(pollStatus, 1000);
-                } else {
-                    document.getElementById('btn-process').disabled = false;
-                    document.getElementById('status-badge').classList.remove('processing');
-                    if (status.progress >= 100) {
-                        showToast('Done! Your photos are organized! 🎉');
-                    }
-                }
-            } catch (e) {
-                setTimeout(pollStatus, 2000);
-            }
-        }
-
-        // Open review interface
-        function openReview() {
-            window.location.href = '/review';
-        }
-
-        // Open library folder
-        async function openLibrary() {
-            try {
-                const response = await fetch('/api/open-library', {method: 'POST'});
-                const result = await response.json();
-                if (result.success) {
-                    showToast('Opening folder...');
-                } else {
-                    showToast(result.message || 'Could not open folder');
-                }
-            } catch (e) {
-                showToast('Failed to open folder');
-            }
-        }
-
-        // Initialize
-        loadSettings();
-
-        // Check status on load
-        fetch('/api/status').then(r => r.json()).then(status => {
-            if (status.is_processing) {
-                document.getElementById('btn-process').disabled = true;
-                document.getElementById('progress-section').classList.remove('hidden');
-                document.getElementById('status-badge').classList.add('processing');
-                pollStatus();
-            }
-            if (status.log.length > 0) {
-                document.getElementById('log-container').innerHTML = status.log.join('<br>');
-            }
-        });
-    </script>
-</body>
-</html>
-'''
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Read once at import; kept as UTF-8 bytes since it is only ever spliced, never rendered
+HTML_TEMPLATE = (TEMPLATES_DIR / "index.html").read_bytes()
+
+
+def build_cached_page(body):
+    """Hash and precompress a static response body once, for every request to reuse"""
+    encodings = {'identity': body, 'gzip': gzip.compress(body, 9)}
+    if HAS_BROTLI:
+        encodings['br'] = brotli.compress(body, quality=11)
+    return {
+        'etag': hashlib.blake2b(body, digest_size=16).hexdigest(),
+        'encodings': encodings,
+    }
+
+
+def cached_page_response(page, mimetype, cache_control):
+    """Serve a page from build_cached_page, negotiating encoding and If-None-Match"""
+    encoding = 'identity'
+    for candidate in ('br', 'gzip'):
+        if candidate in page['encodings'] and request.accept_encodings[candidate]:
+            encoding = candidate
+            break
+
+    etag = page['etag'] if encoding == 'identity' else f"{page['etag']}-{encoding}"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(page['encodings'][encoding], mimetype=mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+STATIC_DIR = Path(__file__).parent / "static"
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js):
+    """Strip indentation, blank lines and full-line comments from a script"""
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+def minify_inline_styles(html):
+    """Run minify_css over every inline <style> block of a page"""
+    return re.sub(r'(<style>)(.*?)(</style>)',
+                  lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3),
+                  html, flags=re.S)
+
+
+def load_static_assets():
+    """Minify the front-end assets into content-hashed, precompressed pages"""
+    assets = {}
+    names = {}
+    for filename, minify, mimetype in (('app.css', minify_css, 'text/css'),
+                                       ('app.js', minify_js, 'text/javascript')):
+        body = minify((STATIC_DIR / filename).read_text(encoding='utf-8')).encode('utf-8')
+        stem, ext = os.path.splitext(filename)
+        name = f"{stem}.{hashlib.blake2b(body, digest_size=8).hexdigest()}{ext}"
+        assets[name] = dict(build_cached_page(body), mimetype=mimetype)
+        names[filename] = name
+    return assets, names
+
+
+STATIC_ASSETS, ASSET_NAMES = load_static_assets()
+
+# The review page has no placeholders at all: minify, hash and compress it once
+REVIEW_PAGE = build_cached_page(minify_inline_styles(
+    (TEMPLATES_DIR / "review.html").read_text(encoding='utf-8')).encode('utf-8'))
+
+# Split the home page once at import into literal chunks and placeholder names,
+# so each render is a bytes join instead of a Jinja parse and render.
+_INDEX_PARTS = re.split(
+    rb'\{\{ (\w+) \}\}',
+    HTML_TEMPLATE
+    .replace(b'{{ app_css }}', ASSET_NAMES['app.css'].encode('ascii'))
+    .replace(b'{{ app_js }}', ASSET_NAMES['app.js'].encode('ascii'))
+)
+_index_page = {}
+
+
+def get_index_page():
+    """Return the rendered home page, rebuilt only when its bootstrap data changes
+
+    The settings the page needs on load are inlined as window.__BOOT__ so the
+    browser does not have to make a separate /api/settings request.
+    """
+    global _index_page
+    local_ip = get_local_ip()
+    boot = {"base_path": load_settings().get('base_path', ''), "local_ip": local_ip}
+    # "</" must not appear inside an inline <script>
+    boot_json = json_bytes(boot).replace(b'</', b'<\\/')
+    if _index_page.get('boot_json') != boot_json:
+        values = {b'local_ip': local_ip.encode('ascii'), b'boot_json': boot_json}
+        body = b''.join(values[part] if i % 2 else part for i, part in enumerate(_INDEX_PARTS))
+        _index_page = dict(build_cached_page(body), boot_json=boot_json)
+    return _index_page
 
 
 # =============================================================================
@@ -862,12 +438,26 @@ HTML_TEMPLATE = '''
 
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE, local_ip=get_local_ip())
+    return cached_page_response(get_index_page(), 'text/html', 'no-cache')
+
+
+@app.route('/assets/<name>')
+def get_asset(name):
+    """Serve a minified front-end asset; names are content-hashed so cache forever"""
+    page = STATIC_ASSETS.get(name)
+    if page is None:
+        abort(404)
+    return cached_page_response(page, page['mimetype'], ASSET_CACHE_CONTROL)
 
 
 @app.route('/api/settings', methods=['GET'])
 def get_settings():
-    return jsonify(load_settings())
+    """Current settings, with an ETag so an unchanged reload costs a 304"""
+    body = json_bytes(load_settings())
+    response = Response(body, mimetype='application/json')
+    response.set_etag(hashlib.blake2b(body, digest_size=8).hexdigest())
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 
 @app.route('/api/settings', methods=['POST'])
@@ -879,6 +469,7 @@ def update_settings():
             return jsonify({"success": False, "error": "No data provided"}), 400
         
         settings = load_settings()
+        old_settings = dict(settings)
         
         # Validate base_path if provided
         if 'base_path' in data:
@@ -886,11 +477,10 @@ def update_settings():
             if not base_path:
                 return jsonify({"success": False, "error": "Base path cannot be empty"}), 400
             
-            base_path_obj = Path(base_path)
-            if not base_path_obj.exists():
+            if not os.path.exists(base_path):
                 return jsonify({"success": False, "error": f"Directory does not exist: {base_path}"}), 400
             
-            if not base_path_obj.is_dir():
+            if not os.path.isdir(base_path):
                 return jsonify({"success": False, "error": f"Path is not a directory: {base_path}"}), 400
             
             settings['base_path'] = base_path
@@ -900,6 +490,9 @@ def update_settings():
             settings['exiftool_path'] = data['exiftool_path']
             logger.info(f"Updated exiftool_path to: {data['exiftool_path']}")
         
+        if settings == old_settings:
+            return jsonify({"success": True, "unchanged": True})
+
         if save_settings(settings):
             return jsonify({"success": True})
         else:
@@ -912,47 +505,163 @@ def update_settings():
 
 @app.route('/api/status')
 def get_status():
-    return jsonify(processing_status)
+    """Current status plus the log lines added after ?since=<log_seq>"""
+    return fast_json(status_snapshot(request.args.get('since', 0, type=int)))
+
+
+def status_snapshot(since=0):
+    """Copy the parts of processing_status the UI renders, with only the new log lines
+
+    log_from is the sequence number of the first line in log_new, so a client
+    that already has some of those lines can skip them.
+    """
+    with log_lock:
+        log = list(processing_status["log"])
+        log_seq = processing_status["log_seq"]
+        log_start = processing_status["log_start"]
+    first = log_seq - len(log)
+    if since > log_seq:
+        since = 0  # Client is ahead of us (server restarted): resend everything
+    skip = min(max(since - first, 0), len(log))
+    return {
+        "is_processing": processing_status["is_processing"],
+        "progress": processing_status["progress"],
+        "status": processing_status["status"],
+        "log_start": log_start,
+        "log_seq": log_seq,
+        "log_from": first + skip,
+        "log_new": log[skip:],
+    }
+
+
+def status_key():
+    """Cheap fingerprint of processing_status used to detect changes"""
+    return (processing_status["is_processing"], processing_status["progress"],
+            processing_status["status"], processing_status["log_start"],
+            processing_status["log_seq"])
+
+
+@app.route('/api/status/stream')
+def stream_status():
+    """Push processing_status to the browser as Server-Sent Events when it changes"""
+    def generate(since):
+        last = None
+        while True:
+            with status_changed:
+                changed = status_changed.wait_for(lambda: status_key() != last,
+                                                  timeout=STATUS_HEARTBEAT_SECONDS)
+                last = status_key()
+            if not changed:
+                yield b": keepalive\n\n"
+                continue
+            snapshot = status_snapshot(since)
+            yield b"data: " + json_bytes(snapshot) + b"\n\n"
+            since = snapshot["log_seq"]
+
+    return Response(generate(request.args.get('since', 0, type=int)),
+                    mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+def lower_thread_priority():
+    """Best effort: let the calling thread yield the CPU to request handlers
+
+    Only the current thread is affected. On Linux a thread has its own nice
+    value, and threads and ExifTool children it starts afterwards inherit it;
+    on Windows SetThreadPriority is per thread. Elsewhere nice is
+    process-wide, so nothing is changed.
+    """
+    try:
+        if os.name == 'nt':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_BELOW_NORMAL)
+        elif sys.platform.startswith('linux'):
+            tid = threading.get_native_id()
+            os.setpriority(os.PRIO_PROCESS, tid, os.getpriority(os.PRIO_PROCESS, tid) + WORKER_NICENESS)
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not lower worker priority: {e}")
+
+
+def start_job(target, *args):
+    """Run target(*args) on a daemon thread and return a Future for its outcome
+
+    A daemon thread rather than an executor, so stopping the server never
+    waits for a long processing run to finish.
+    """
+    future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(target(*args))
+        except BaseException as e:
+            logger.error(f"Background job {target.__name__} failed: {e}", exc_info=True)
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=target.__name__, daemon=True).start()
+    return future
+
+
+# The current processing run; _process_lock makes check-and-start atomic
+_process_future: Optional[Future] = None
+_process_lock = threading.Lock()
 
 
 @app.route('/api/process', methods=['POST'])
 def start_processing():
-    """Start photo processing with validation"""
-    global processing_status
+    """Start photo processing with validation
+
+    A request made while a run is active joins that run instead of starting
+    another one.
+    """
+    global _process_future
 
     try:
-        if processing_status["is_processing"]:
-            logger.warning("Processing already in progress")
-            return jsonify({"success": False, "message": "Already processing"}), 409
-        
-        # Validate settings before starting
-        settings = load_settings()
-        base_path = settings.get('base_path')
-        
-        if not base_path:
-            error_msg = "No base path configured. Please set base path in settings first."
-            logger.error(error_msg)
-            add_log(f"✗ ERROR: {error_msg}")
-            return jsonify({"success": False, "error": error_msg}), 400
-        
-        base_path_obj = Path(base_path)
-        if not base_path_obj.exists():
-            error_msg = f"Base path does not exist: {base_path}"
-            logger.error(error_msg)
-            add_log(f"✗ ERROR: {error_msg}")
-            return jsonify({"success": False, "error": error_msg}), 400
-
-        if not HAS_PROCESSOR:
-            # Demo mode - simulate processing
-            logger.info("Starting demo processing mode")
-            threading.Thread(target=demo_processing, daemon=True).start()
-            return jsonify({"success": True, "message": "Started (demo mode)"})
-
-        # Start real processing in background
-        logger.info("Starting real photo processing")
-        threading.Thread(target=run_processing, daemon=True).start()
-        return jsonify({"success": True})
-        
+        with _process_lock:
+            if _process_future is not None and not _process_future.done():
+                logger.info("Processing already in progress, joining it")
+                return jsonify({"success": True, "message": "Already processing", "joined": True})
+
+            # Validate settings before starting
+            settings = load_settings()
+            base_path = settings.get('base_path')
+
+            if not base_path:
+                error_msg = "No base path configured. Please set base path in settings first."
+                logger.error(error_msg)
+                add_log(f"✗ ERROR: {error_msg}")
+                return jsonify({"success": False, "error": error_msg}), 400
+
+            # One stat answers both "does it exist" and "is it a directory"
+            try:
+                is_dir = stat.S_ISDIR(os.stat(base_path).st_mode)
+                error_msg = None if is_dir else f"Base path is not a directory: {base_path}"
+            except OSError:
+                # Missing, under a regular file (ENOTDIR) or behind an unreadable folder
+                error_msg = f"Base path does not exist or is not accessible: {base_path}"
+            if error_msg:
+                logger.error(error_msg)
+                add_log(f"✗ ERROR: {error_msg}")
+                return jsonify({"success": False, "error": error_msg}), 400
+
+            # Mark the run before replying, so a status stream the client opens
+            # next never sees an idle snapshot and closes straight away
+            update_status_fields(is_processing=True, progress=0)
+
+            if not HAS_PROCESSOR:
+                # Demo mode - simulate processing
+                logger.info("Starting demo processing mode")
+                _process_future = start_job(demo_processing)
+                return jsonify({"success": True, "message": "Started (demo mode)"})
+
+            # Start real processing in background. The drain thread is started
+            # here, since threads created by the lowered-priority job inherit it
+            logger.info("Starting real photo processing")
+            start_status_drain()
+            _process_future = start_job(run_processing, settings)
+            return jsonify({"success": True})
+
     except Exception as e:
         error_msg = f"Failed to start processing: {str(e)}"
         logger.error(error_msg, exc_info=True)
@@ -962,11 +671,9 @@ def start_processing():
 def demo_processing():
     """Demo processing for testing UI without PhotoProcessor"""
     global processing_status
-    import time
 
-    processing_status["is_processing"] = True
-    processing_status["progress"] = 0
-    processing_status["log"] = []
+    update_status_fields(is_processing=True, progress=0)
+    clear_log()
 
     steps = [
         (10, "Finding photos..."),
@@ -978,38 +685,96 @@ def demo_processing():
         (100, "Done! Your photos are organized!")
     ]
 
+    # Steps are scheduled against the monotonic clock so they don't drift
+    next_step = time.monotonic()
     for progress, status in steps:
-        time.sleep(2)
-        processing_status["progress"] = progress
-        processing_status["status"] = status
+        next_step += DEMO_STEP_SECONDS
+        if shutdown_event.wait(max(0.0, next_step - time.monotonic())):
+            break
+        update_status_fields(progress=progress, status=status)
         add_log(status)
 
-    processing_status["is_processing"] = False
+    update_status_fields(is_processing=False)
+
+
+# Progress/status reported by the processor, applied by the drain thread
+_status_updates = queue.SimpleQueue()
+_status_drain_lock = threading.Lock()
+_status_drain_thread = None
 
 
-def run_processing():
-    """Run actual photo processing with comprehensive error handling"""
+def _drain_status_updates():
+    """Apply queued processor updates to processing_status, in order"""
+    while True:
+        kind, value = _status_updates.get()
+        try:
+            if kind == 'progress':
+                update_status_fields(progress=min(100, max(0, value)))
+                logger.debug(f"Progress: {value}%")
+            elif kind == 'status':
+                update_status_fields(status=value)
+                add_log(value)
+                logger.info(f"Status: {value}")
+            elif kind == 'flush':
+                value.set()
+        except Exception as e:
+            logger.error(f"Error applying status update {kind!r}: {e}", exc_info=True)
+
+
+def progress_percent(progress):
+    """Percent complete from a processor progress report
+
+    PhotoProcessorEnhanced reports its live ProcessingProgress object, so the
+    value is taken now rather than when the drain thread gets to it.
+    """
+    if hasattr(progress, 'percent_complete'):
+        return progress.percent_complete()
+    return progress
+
+
+def start_status_drain():
+    """Start the drain thread the first time processing runs"""
+    global _status_drain_thread
+    with _status_drain_lock:
+        if _status_drain_thread is None:
+            _status_drain_thread = threading.Thread(
+                target=_drain_status_updates, name='status-drain', daemon=True)
+            _status_drain_thread.start()
+
+
+def flush_status_updates(timeout=5.0):
+    """Wait until every update queued so far has been applied"""
+    done = threading.Event()
+    _status_updates.put(('flush', done))
+    done.wait(timeout)
+
+
+def run_processing(settings):
+    """Run actual photo processing with comprehensive error handling
+
+    settings are the ones start_processing already loaded and validated.
+    """
     global processing_status
 
-    processing_status["is_processing"] = True
-    processing_status["progress"] = 0
-    processing_status["log"] = []
+    lower_thread_priority()
+    update_status_fields(is_processing=True, progress=0)
+    clear_log()
     add_log("Starting photo processing...")
     logger.info("Starting photo processing workflow")
 
     try:
-        # Load and validate settings
-        settings = load_settings()
+        # Validate settings again; the folder may have changed since the request
         base_path = settings.get('base_path')
         
         if not base_path:
             raise ValueError("No base path configured. Please set base path in settings.")
         
-        base_path_obj = Path(base_path)
-        if not base_path_obj.exists():
-            raise FileNotFoundError(f"Base path does not exist: {base_path}")
+        try:
+            base_mode = os.stat(base_path).st_mode
+        except OSError:
+            raise FileNotFoundError(f"Base path does not exist or is not accessible: {base_path}") from None
         
-        if not base_path_obj.is_dir():
+        if not stat.S_ISDIR(base_mode):
             raise NotADirectoryError(f"Base path is not a directory: {base_path}")
         
         logger.info(f"Using base path: {base_path}")
@@ -1023,25 +788,20 @@ def run_processing():
         )
         logger.info("PhotoProcessor initialized successfully")
 
-        def update_progress(p):
-            processing_status["progress"] = min(100, max(0, p))
-            logger.debug(f"Progress: {p}%")
-
-        def update_status(s):
-            processing_status["status"] = s
-            add_log(s)
-            logger.info(f"Status: {s}")
-
-        processor.progress_callback = update_progress
-        processor.status_callback = update_status
+        # The callbacks only enqueue, so the pipeline never waits on status bookkeeping
+        processor.progress_callback = lambda p: _status_updates.put(('progress', progress_percent(p)))
+        processor.status_callback = lambda s: _status_updates.put(('status', s))
 
         # Run pipeline
         add_log("Running full processing pipeline...")
-        stats, issues = processor.run_full_pipeline()
+        try:
+            stats, issues = processor.run_full_pipeline()
+        finally:
+            # Apply queued updates before the final status below
+            flush_status_updates()
 
         # Success!
-        processing_status["progress"] = 100
-        processing_status["status"] = "Complete!"
+        update_status_fields(progress=100, status="Complete!")
         add_log("✓ Processing complete!")
         
         summary = processor.get_summary()
@@ -1050,26 +810,26 @@ def run_processing():
 
     except FileNotFoundError as e:
         error_msg = f"Directory not found: {str(e)}"
-        processing_status["status"] = f"ERROR: {error_msg}"
+        update_status_fields(status=f"ERROR: {error_msg}")
         add_log(f"✗ ERROR: {error_msg}")
         logger.error(error_msg, exc_info=True)
         
     except PermissionError as e:
         error_msg = f"Permission denied: {str(e)}"
-        processing_status["status"] = f"ERROR: {error_msg}"
+        update_status_fields(status=f"ERROR: {error_msg}")
         add_log(f"✗ ERROR: {error_msg}")
         add_log("Tip: Make sure you have write permissions to the directory")
         logger.error(error_msg, exc_info=True)
         
     except ValueError as e:
         error_msg = f"Invalid configuration: {str(e)}"
-        processing_status["status"] = f"ERROR: {error_msg}"
+        update_status_fields(status=f"ERROR: {error_msg}")
         add_log(f"✗ ERROR: {error_msg}")
         logger.error(error_msg, exc_info=True)
         
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        processing_status["status"] = f"ERROR: {error_msg}"
+        update_status_fields(status=f"ERROR: {error_msg}")
         add_log(f"✗ ERROR: {error_msg}")
         add_log(f"Error type: {type(e).__name__}")
         
@@ -1088,7 +848,8 @@ def run_processing():
         add_log("Full error details saved to photo_manager_web.log")
 
     finally:
-        processing_status["is_processing"] = False
+        update_status_fields(is_processing=False)
+        invalidate_review_cache()
         logger.info("Processing workflow ended")
 
 
@@ -1102,19 +863,24 @@ def open_library():
         if not base_path:
             return jsonify({"success": False, "message": "No base path configured"}), 400
         
-        library_path = Path(base_path) / "Photos & Videos"
-
-        if not library_path.exists():
-            logger.warning(f"Library folder does not exist: {library_path}")
-            return jsonify({"success": False, "message": "Library folder doesn't exist yet. Run processing first!"}), 404
+        library_path = os.path.join(base_path, "Photos & Videos")
+        not_yet = {"success": False, "message": "Library folder doesn't exist yet. Run processing first!"}
 
         if os.name == 'nt':  # Windows
-            os.startfile(str(library_path))
-            logger.info(f"Opened library folder: {library_path}")
+            # startfile reports a missing folder itself, so no separate exists() probe
+            try:
+                os.startfile(library_path)
+            except FileNotFoundError:
+                logger.warning(f"Library folder does not exist: {library_path}")
+                return jsonify(not_yet), 404
         else:  # macOS/Linux
+            # xdg-open runs detached and can't report a missing folder back
+            if not os.path.isdir(library_path):
+                logger.warning(f"Library folder does not exist: {library_path}")
+                return jsonify(not_yet), 404
             import subprocess
-            subprocess.Popen(['xdg-open', str(library_path)])
-            logger.info(f"Opened library folder: {library_path}")
+            subprocess.Popen(['xdg-open', library_path], start_new_session=True)
+        logger.info(f"Opened library folder: {library_path}")
         
         return jsonify({"success": True})
         
@@ -1128,8 +894,33 @@ def open_library():
 
 @app.route('/review')
 def review():
-    """Mobile-friendly review interface"""
-    return render_template_string(REVIEW_TEMPLATE, local_ip=get_local_ip())
+    """Mobile-friendly review interface
+
+    The page is static, so it is encoded, hashed and compressed once.
+    """
+    return cached_page_response(REVIEW_PAGE, 'text/html', 'no-cache')
+
+
+# Match the folder names created by PhotoProcessor
+REVIEW_CATEGORY_FOLDERS = [
+    ('NEEDS ATTENTION - Duplicates', 'Duplicates'),
+    ('NEEDS ATTENTION - Burst Photos', 'Burst Photos'),
+    ('NEEDS ATTENTION - Blurry or Corrupt', 'Quality Issues'),
+    ('NEEDS ATTENTION - Too Small', 'Too Small'),
+    ('Duplicates', 'Duplicates'),
+    ('Burst Photos', 'Burst Photos'),
+    ('Quality Issues', 'Quality Issues'),
+]
+
+# Last /api/review/groups body, keyed on the category folders and their mtimes
+_review_cache = {"key": None, "body": None}
+_review_cache_lock = threading.Lock()
+
+
+def invalidate_review_cache():
+    """Forget the cached review listing; called whenever groups are changed"""
+    with _review_cache_lock:
+        _review_cache["key"] = None
 
 
 @app.route('/api/review/groups')
@@ -1145,67 +936,156 @@ def get_review_groups():
         
         review_dir = Path(base_path) / "Pics Waiting for Approval"
 
-        if not review_dir.exists():
+        if not os.path.exists(review_dir):
             logger.info(f"Review directory does not exist: {review_dir}")
             return jsonify({"groups": [], "message": "No photos to review"})
 
-        groups = []
-        # Match the folder names created by PhotoProcessor
-        category_folders = [
-            ('NEEDS ATTENTION - Duplicates', 'Duplicates'),
-            ('NEEDS ATTENTION - Burst Photos', 'Burst Photos'),
-            ('NEEDS ATTENTION - Blurry or Corrupt', 'Quality Issues'),
-            ('NEEDS ATTENTION - Too Small', 'Too Small'),
-            ('Duplicates', 'Duplicates'),
-            ('Burst Photos', 'Burst Photos'),
-            ('Quality Issues', 'Quality Issues'),
-        ]
-
-        for folder_name, category in category_folders:
+        # The old and new folder names can be the same directory (case-insensitive
+        # filesystems, links); scan each real directory once so groups aren't listed twice
+        seen = set()
+        cat_dirs = []
+        for folder_name, category in REVIEW_CATEGORY_FOLDERS:
             cat_dir = review_dir / folder_name
-            if cat_dir.exists():
-                try:
-                    for group_folder in cat_dir.iterdir():
-                        if group_folder.is_dir():
-                            photos = []
-                            for ext in ['.jpg', '.jpeg', '.png', '.heic', '.gif', '.webp']:
-                                photos.extend([p.name for p in group_folder.glob(f'*{ext}')])
-                                photos.extend([p.name for p in group_folder.glob(f'*{ext.upper()}')])
-
-                            if photos:
-                                best = next((p for p in photos if p.startswith('BEST_')), photos[0] if photos else None)
-                                groups.append({
-                                    "id": str(group_folder),
-                                    "name": group_folder.name,
-                                    "category": category,
-                                    "photos": photos,
-                                    "best": best,
-                                    "count": len(photos)
-                                })
-                except PermissionError as e:
-                    logger.error(f"Permission denied accessing {cat_dir}: {e}")
-                except Exception as e:
-                    logger.error(f"Error scanning {cat_dir}: {e}", exc_info=True)
+            real_dir = os.path.normcase(os.path.realpath(cat_dir))
+            if real_dir in seen:
+                continue
+            seen.add(real_dir)
+            try:
+                mtime_ns = os.stat(cat_dir).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.error(f"Error accessing {cat_dir}: {e}")
+                continue
+            cat_dirs.append((cat_dir, category, mtime_ns))
+
+        # Adding or removing a group changes its category folder's mtime
+        key = (str(review_dir), tuple((str(d), m) for d, _, m in cat_dirs))
+        with _review_cache_lock:
+            if _review_cache["key"] == key:
+                return Response(_review_cache["body"], mimetype='application/json')
+
+        groups = []
+        for cat_dir, category, _ in cat_dirs:
+            try:
+                with os.scandir(cat_dir) as group_entries:
+                    # Hidden folders are groups still being deleted
+                    group_folders = [e for e in group_entries
+                                     if not e.name.startswith('.') and e.is_dir()]
+                for group_folder in group_folders:
+                    # One directory read per group, using the DirEntry type info
+                    with os.scandir(group_folder.path) as entries:
+                        photos = sorted(
+                            e.name for e in entries
+                            if os.path.splitext(e.name)[1].lower() in PHOTO_EXTS
+                            and e.is_file()
+                        )
+
+                    if photos:
+                        best = next((p for p in photos if p.startswith(BEST_PREFIX)), photos[0])
+                        groups.append({
+                            "id": group_folder.path,
+                            "name": group_folder.name,
+                            "category": category,
+                            "photos": photos,
+                            "best": best,
+                            "count": len(photos)
+                        })
+            except PermissionError as e:
+                logger.error(f"Permission denied accessing {cat_dir}: {e}")
+            except Exception as e:
+                logger.error(f"Error scanning {cat_dir}: {e}", exc_info=True)
 
         logger.info(f"Found {len(groups)} review groups")
-        return jsonify({"groups": groups, "total": len(groups)})
+        body = json_bytes({"groups": groups, "total": len(groups)})
+        with _review_cache_lock:
+            _review_cache["key"] = key
+            _review_cache["body"] = body
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error getting review groups: {e}", exc_info=True)
         return jsonify({"groups": [], "message": f"Error: {str(e)}", "error": "server"}), 500
 
 
+# Review photos don't change under the same path, so let the browser reuse them
+REVIEW_PHOTO_MAX_AGE = 3600
+
+
 @app.route('/api/review/photo/<path:photo_path>')
 def get_review_photo(photo_path):
-    """Serve a photo for review"""
-    return send_from_directory('/', photo_path)
+    """Serve a photo for review
+
+    Responses carry an ETag and Last-Modified, so revalidation returns 304,
+    and may be cached privately for REVIEW_PHOTO_MAX_AGE seconds.
+    """
+    response = send_from_directory('/', photo_path, conditional=True, etag=True,
+                                   max_age=REVIEW_PHOTO_MAX_AGE)
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
+
+
+def folder_names(folder):
+    """Names already in folder, case-folded the way the filesystem compares them"""
+    return {os.path.normcase(name) for name in os.listdir(folder)}
+
+
+def strip_best_prefix(name):
+    """Library name for a review photo: the BEST_ marker is only a leading prefix"""
+    return name[len(BEST_PREFIX):] if name.startswith(BEST_PREFIX) else name
+
+
+def unique_name(name, existing):
+    """Return name, or name_1, name_2, ... if taken, and reserve it in existing
+
+    Conflicts are resolved against the in-memory set from folder_names(),
+    so no filesystem probe is needed per candidate.
+    """
+    if os.path.normcase(name) in existing:
+        stem, ext = os.path.splitext(name)
+        counter = 1
+        while os.path.normcase(f"{stem}_{counter}{ext}") in existing:
+            counter += 1
+        name = f"{stem}_{counter}{ext}"
+    existing.add(os.path.normcase(name))
+    return name
+
+
+def move_file(src, dst):
+    """Move a file with a single rename, copying only when dst is on another device
+
+    dst must be a free name (see unique_name); os.replace overwrites.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def remove_tree_later(folder):
+    """Delete a folder in the background so the request can return straight away
+
+    The folder is first renamed to a hidden sibling, so it disappears from
+    the review listing immediately even though its files are still going.
+    """
+    folder = str(folder)
+    parent, name = os.path.split(folder)
+    doomed = os.path.join(parent, f".deleting-{name}-{uuid.uuid4().hex}")
+    try:
+        os.rename(folder, doomed)
+    except OSError:
+        doomed = folder
+    return _background_pool.submit(shutil.rmtree, doomed, ignore_errors=True)
 
 
 @app.route('/api/review/action', methods=['POST'])
 def review_action():
     """Handle review actions (keep, delete, keep all) with comprehensive error handling"""
     try:
-        data = request.json
+        data = request.get_json(silent=True)
         if not data:
             return jsonify({"success": False, "message": "No data provided"}), 400
         
@@ -1225,10 +1105,12 @@ def review_action():
         if not base_path:
             return jsonify({"success": False, "message": "No base path configured"}), 400
         
-        library_path = Path(base_path) / "Photos & Videos"
-        group_folder = Path(group_path)
+        # Plain string paths: these are joined once per moved photo
+        library_path = os.path.join(base_path, "Photos & Videos")
+        group_folder = group_path
+        group_name = os.path.basename(os.path.normpath(group_folder))
         
-        if not group_folder.exists():
+        if not os.path.exists(group_folder):
             logger.warning(f"Group folder does not exist: {group_folder}")
             return jsonify({"success": False, "message": "Group folder no longer exists"}), 404
 
@@ -1237,67 +1119,60 @@ def review_action():
                 return jsonify({"success": False, "message": "No photo specified"}), 400
             
             # Keep selected photo, move to library
-            photo_path = group_folder / photo
-            if not photo_path.exists():
+            photo_path = os.path.join(group_folder, photo)
+            if not os.path.exists(photo_path):
                 logger.warning(f"Photo does not exist: {photo_path}")
                 return jsonify({"success": False, "message": f"Photo not found: {photo}"}), 404
             
             # Organize by date
-            mtime = datetime.fromtimestamp(photo_path.stat().st_mtime)
-            dest_folder = library_path / str(mtime.year) / f"{mtime.month:02d}"
-            dest_folder.mkdir(parents=True, exist_ok=True)
+            mtime = time.localtime(os.stat(photo_path).st_mtime)
+            dest_folder = os.path.join(library_path, str(mtime.tm_year), f"{mtime.tm_mon:02d}")
+            os.makedirs(dest_folder, exist_ok=True)
 
-            # Remove BEST_ prefix if present
-            new_name = photo.replace('BEST_', '')
-            dest_path = dest_folder / new_name
+            # Remove BEST_ prefix if present, renaming on conflict
+            dest_path = os.path.join(
+                dest_folder, unique_name(strip_best_prefix(photo), folder_names(dest_folder)))
             
-            # Handle name conflicts
-            counter = 1
-            while dest_path.exists():
-                stem = dest_path.stem
-                ext = dest_path.suffix
-                dest_path = dest_folder / f"{stem}_{counter}{ext}"
-                counter += 1
-            
-            shutil.move(str(photo_path), str(dest_path))
+            move_file(photo_path, dest_path)
             logger.info(f"Kept photo: {photo} -> {dest_path}")
 
             # Delete the rest
-            shutil.rmtree(str(group_folder), ignore_errors=True)
+            remove_tree_later(group_folder)
             return jsonify({"success": True, "message": f"Kept {photo}"})
 
         elif action == 'keep_all':
             # Move all photos to library
             moved_count = 0
-            for photo_file in group_folder.iterdir():
-                if photo_file.is_file() and photo_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.heic', '.gif', '.webp']:
-                    try:
-                        mtime = datetime.fromtimestamp(photo_file.stat().st_mtime)
-                        dest_folder = library_path / str(mtime.year) / f"{mtime.month:02d}"
-                        dest_folder.mkdir(parents=True, exist_ok=True)
-                        new_name = photo_file.name.replace('BEST_', '')
-                        dest_path = dest_folder / new_name
-                        
-                        # Handle name conflicts
-                        counter = 1
-                        while dest_path.exists():
-                            stem = dest_path.stem
-                            ext = dest_path.suffix
-                            dest_path = dest_folder / f"{stem}_{counter}{ext}"
-                            counter += 1
-                        
-                        shutil.move(str(photo_file), str(dest_path))
-                        moved_count += 1
-                    except Exception as e:
-                        logger.error(f"Error moving {photo_file}: {e}")
-
-            shutil.rmtree(str(group_folder), ignore_errors=True)
-            logger.info(f"Kept all photos from {group_folder.name}: {moved_count} files")
+            with os.scandir(group_folder) as entries:
+                photo_files = [
+                    e for e in entries
+                    if os.path.splitext(e.name)[1].lower() in PHOTO_EXTS and e.is_file()
+                ]
+            # (year, month) -> (folder, names in it), created and listed once per request
+            dest_folders = {}
+            for photo_file in photo_files:
+                try:
+                    mtime = time.localtime(photo_file.stat().st_mtime)
+                    month = (mtime.tm_year, mtime.tm_mon)
+                    if month not in dest_folders:
+                        dest_folder = os.path.join(library_path, str(mtime.tm_year), f"{mtime.tm_mon:02d}")
+                        os.makedirs(dest_folder, exist_ok=True)
+                        dest_folders[month] = (dest_folder, folder_names(dest_folder))
+                    dest_folder, existing = dest_folders[month]
+                    dest_path = os.path.join(dest_folder, unique_name(strip_best_prefix(photo_file.name), existing))
+                    
+                    move_file(photo_file.path, dest_path)
+                    moved_count += 1
+                except Exception as e:
+                    logger.error(f"Error moving {photo_file.path}: {e}")
+
+            remove_tree_later(group_folder)
+            logger.info(f"Kept all photos from {group_name}: {moved_count} files")
             return jsonify({"success": True, "message": f"Kept all {moved_count} photos"})
 
         elif action == 'delete_all':
-            shutil.rmtree(str(group_folder), ignore_errors=True)
-            logger.info(f"Deleted group: {group_folder.name}")
+            remove_tree_later(group_folder)
+            logger.info(f"Deleted group: {group_name}")
             return jsonify({"success": True, "message": "Deleted group"})
 
         logger.warning(f"Unknown action: {action}")
@@ -1312,248 +1187,50 @@ def review_action():
     except Exception as e:
         logger.error(f"Error in review action: {e}", exc_info=True)
         return jsonify({"success": False, "message": f"Error: {str(e)}"}), 500
+    finally:
+        invalidate_review_cache()
 
 
-REVIEW_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=no">
-    <meta name="theme-color" content="#1a1a2e">
-    <title>Review Photos</title>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <link href="https://fonts.googleapis.com/icon?family=Material+Icons+Round" rel="stylesheet">
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: 'Poppins', sans-serif; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); min-height: 100vh; color: #fff; }
-        .header { background: rgba(0,0,0,0.3); padding: 15px 20px; display: flex; align-items: center; gap: 15px; position: sticky; top: 0; z-index: 100; }
-        .header a { color: #e94560; text-decoration: none; font-size: 24px; }
-        .header h1 { font-size: 18px; flex: 1; }
-        .header .count { background: #e94560; padding: 5px 12px; border-radius: 20px; font-size: 12px; }
-        .container { padding: 20px; max-width: 600px; margin: 0 auto; }
-        .empty { text-align: center; padding: 60px 20px; }
-        .empty .icon { font-size: 64px; color: #4CAF50; margin-bottom: 20px; }
-        .empty h2 { color: #4CAF50; margin-bottom: 10px; }
-        .empty p { color: #a0a0a0; }
-        .group-card { background: rgba(255,255,255,0.05); border-radius: 16px; margin-bottom: 20px; overflow: hidden; border: 1px solid rgba(255,255,255,0.1); }
-        .group-header { padding: 15px; display: flex; justify-content: space-between; align-items: center; border-bottom: 1px solid rgba(255,255,255,0.1); }
-        .group-header h3 { font-size: 14px; font-weight: 600; }
-        .group-header .badge { background: #e94560; padding: 4px 10px; border-radius: 12px; font-size: 11px; }
-        .group-header .badge.duplicates { background: #FF9800; }
-        .group-header .badge.burst { background: #2196F3; }
-        .group-header .badge.quality { background: #f44336; }
-        .photo-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(100px, 1fr)); gap: 8px; padding: 15px; }
-        .photo-item { position: relative; aspect-ratio: 1; border-radius: 8px; overflow: hidden; cursor: pointer; border: 3px solid transparent; }
-        .photo-item img { width: 100%; height: 100%; object-fit: cover; }
-        .photo-item.selected { border-color: #4CAF50; }
-        .photo-item.best::after { content: '★'; position: absolute; top: 5px; right: 5px; background: #4CAF50; color: white; width: 20px; height: 20px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 12px; }
-        .group-actions { padding: 15px; display: flex; gap: 10px; border-top: 1px solid rgba(255,255,255,0.1); }
-        .btn { flex: 1; padding: 12px; border: none; border-radius: 10px; font-family: 'Poppins', sans-serif; font-size: 13px; font-weight: 600; cursor: pointer; display: flex; align-items: center; justify-content: center; gap: 6px; }
-        .btn-keep { background: #4CAF50; color: white; }
-        .btn-keep-all { background: #2196F3; color: white; }
-        .btn-delete { background: #f44336; color: white; }
-        .btn:disabled { opacity: 0.5; cursor: not-allowed; }
-        .loading { text-align: center; padding: 40px; }
-        .loading .spinner { width: 40px; height: 40px; border: 3px solid rgba(255,255,255,0.1); border-top-color: #e94560; border-radius: 50%; animation: spin 1s linear infinite; margin: 0 auto 15px; }
-        @keyframes spin { to { transform: rotate(360deg); } }
-        .toast { position: fixed; bottom: 20px; left: 50%; transform: translateX(-50%) translateY(100px); background: #333; color: white; padding: 12px 24px; border-radius: 10px; opacity: 0; transition: all 0.3s; z-index: 1000; }
-        .toast.show { transform: translateX(-50%) translateY(0); opacity: 1; }
-        .fullscreen { position: fixed; top: 0; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.95); z-index: 200; display: none; flex-direction: column; }
-        .fullscreen.active { display: flex; }
-        .fullscreen-header { padding: 15px; display: flex; justify-content: space-between; align-items: center; }
-        .fullscreen-header button { background: none; border: none; color: white; font-size: 28px; cursor: pointer; }
-        .fullscreen-image { flex: 1; display: flex; align-items: center; justify-content: center; padding: 20px; }
-        .fullscreen-image img { max-width: 100%; max-height: 100%; object-fit: contain; }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <a href="/"><span class="material-icons-round">arrow_back</span></a>
-        <h1>Review Photos</h1>
-        <div class="count" id="count">0 groups</div>
-    </div>
-
-    <div class="container" id="content">
-        <div class="loading">
-            <div class="spinner"></div>
-            <p>Loading photos...</p>
-        </div>
-    </div>
-
-    <div class="fullscreen" id="fullscreen">
-        <div class="fullscreen-header">
-            <span id="fullscreen-name"></span>
-            <button onclick="closeFullscreen()"><span class="material-icons-round">close</span></button>
-        </div>
-        <div class="fullscreen-image">
-            <img id="fullscreen-img" src="" alt="">
-        </div>
-    </div>
-
-    <div id="toast" class="toast"></div>
-
-    <script>
-        let groups = [];
-        let selectedPhotos = {};
-
-        function showToast(msg) {
-            const t = document.getElementById('toast');
-            t.textContent = msg;
-            t.classList.add('show');
-            setTimeout(() => t.classList.remove('show'), 3000);
-        }
-
-        async function loadGroups() {
-            try {
-                const res = await fetch('/api/review/groups');
-                const data = await res.json();
-                groups = data.groups;
-                document.getElementById('count').textContent = groups.length + ' groups';
-                renderGroups();
-            } catch (e) {
-                document.getElementById('content').innerHTML = '<div class="empty"><p>Error loading photos</p></div>';
-            }
-        }
-
-        function renderGroups() {
-            if (groups.length === 0) {
-                document.getElementById('content').innerHTML = `
-                    <div class="empty">
-                        <div class="icon"><span class="material-icons-round">check_circle</span></div>
-                        <h2>All Done!</h2>
-                        <p>No photos need review. Great job!</p>
-                        <p style="margin-top:20px"><a href="/" style="color:#e94560">← Back to Home</a></p>
-                    </div>`;
-                return;
-            }
-
-            let html = '';
-            groups.forEach((g, idx) => {
-                const badgeClass = g.category.toLowerCase().includes('duplicate') ? 'duplicates' :
-                                   g.category.toLowerCase().includes('burst') ? 'burst' : 'quality';
-                selectedPhotos[idx] = g.best;
-
-                html += `
-                <div class="group-card" id="group-${idx}">
-                    <div class="group-header">
-                        <h3>${g.name}</h3>
-                        <span class="badge ${badgeClass}">${g.category} (${g.count})</span>
-                    </div>
-                    <div class="photo-grid">
-                        ${g.photos.map(p => `
-                            <div class="photo-item ${p === g.best ? 'best selected' : ''}"
-                                 onclick="selectPhoto(${idx}, '${p}')"
-                                 ondblclick="openFullscreen('${g.id}/${p}', '${p}')">
-                                <img src="/api/review/photo/${g.id}/${p}" alt="${p}" loading="lazy">
-                            </div>
-                        `).join('')}
-                    </div>
-                    <div class="group-actions">
-                        <button class="btn btn-keep" onclick="keepOne(${idx})">
-                            <span class="material-icons-round">check</span> Keep Selected
-                        </button>
-                        <button class="btn btn-keep-all" onclick="keepAll(${idx})">
-                            <span class="material-icons-round">done_all</span> Keep All
-                        </button>
-                        <button class="btn btn-delete" onclick="deleteAll(${idx})">
-                            <span class="material-icons-round">delete</span>
-                        </button>
-                    </div>
-                </div>`;
-            });
-            document.getElementById('content').innerHTML = html;
-        }
-
-        function selectPhoto(groupIdx, photo) {
-            selectedPhotos[groupIdx] = photo;
-            const card = document.getElementById('group-' + groupIdx);
-            card.querySelectorAll('.photo-item').forEach(el => {
-                el.classList.remove('selected');
-                if (el.querySelector('img').src.includes(photo)) {
-                    el.classList.add('selected');
-                }
-            });
-        }
-
-        function openFullscreen(path, name) {
-            document.getElementById('fullscreen-img').src = '/api/review/photo/' + path;
-            document.getElementById('fullscreen-name').textContent = name;
-            document.getElementById('fullscreen').classList.add('active');
-        }
-
-        function closeFullscreen() {
-            document.getElementById('fullscreen').classList.remove('active');
-        }
-
-        async function keepOne(idx) {
-            const g = groups[idx];
-            const photo = selectedPhotos[idx];
-            try {
-                const res = await fetch('/api/review/action', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({ action: 'keep_one', group_path: g.id, photo: photo })
-                });
-                const data = await res.json();
-                if (data.success) {
-                    showToast('Kept ' + photo);
-                    groups.splice(idx, 1);
-                    document.getElementById('count').textContent = groups.length + ' groups';
-                    renderGroups();
-                } else {
-                    showToast('Error: ' + data.message);
-                }
-            } catch (e) { showToast('Error saving'); }
-        }
-
-        async function keepAll(idx) {
-            const g = groups[idx];
-            try {
-                const res = await fetch('/api/review/action', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({ action: 'keep_all', group_path: g.id })
-                });
-                const data = await res.json();
-                if (data.success) {
-                    showToast('Kept all photos');
-                    groups.splice(idx, 1);
-                    document.getElementById('count').textContent = groups.length + ' groups';
-                    renderGroups();
-                } else {
-                    showToast('Error: ' + data.message);
-                }
-            } catch (e) { showToast('Error saving'); }
-        }
-
-        async function deleteAll(idx) {
-            if (!confirm('Delete all photos in this group?')) return;
-            const g = groups[idx];
-            try {
-                const res = await fetch('/api/review/action', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({ action: 'delete_all', group_path: g.id })
-                });
-                const data = await res.json();
-                if (data.success) {
-                    showToast('Deleted');
-                    groups.splice(idx, 1);
-                    document.getElementById('count').textContent = groups.length + ' groups';
-                    renderGroups();
-                } else {
-                    showToast('Error: ' + data.message);
-                }
-            } catch (e) { showToast('Error deleting'); }
-        }
-
-        document.addEventListener('keydown', e => { if (e.key === 'Escape') closeFullscreen(); });
-        loadGroups();
-    </script>
-</body>
-</html>
-'''
+# Sub-requests /api/batch may run: (method, path) -> endpoint. Anything else is
+# refused, so a batch can't reach routes that were never meant to be combined.
+BATCH_ENDPOINTS = {
+    ('GET', '/api/settings'): 'get_settings',
+    ('GET', '/api/status'): 'get_status',
+    ('GET', '/api/review/groups'): 'get_review_groups',
+    ('POST', '/api/review/action'): 'review_action',
+}
+BATCH_MAX_REQUESTS = 20
+
+
+@app.route('/api/batch', methods=['POST'])
+def batch():
+    """Run several API calls in one round trip
+
+    Body: {"requests": [{"id", "url", "method", "body"}, ...]}. Returns
+    {id: {"status", "body"}} with each sub-request run in order.
+    """
+    data = request.get_json(silent=True) or {}
+    subrequests = data.get('requests')
+    if not isinstance(subrequests, list) or not subrequests:
+        return jsonify({"success": False, "message": "No requests provided"}), 400
+    if len(subrequests) > BATCH_MAX_REQUESTS:
+        return jsonify({"success": False,
+                        "message": f"At most {BATCH_MAX_REQUESTS} requests per batch"}), 400
+
+    results = {}
+    for i, sub in enumerate(subrequests):
+        sub = sub if isinstance(sub, dict) else {}
+        sub_id = str(sub.get('id', i))
+        url = str(sub.get('url', ''))
+        method = str(sub.get('method', 'GET')).upper()
+        endpoint = BATCH_ENDPOINTS.get((method, urlsplit(url).path))
+        if endpoint is None:
+            results[sub_id] = {"status": 404, "body": {"message": f"Not allowed in a batch: {method} {url}"}}
+            continue
+        with app.test_request_context(url, method=method, json=sub.get('body')):
+            response = app.make_response(app.view_functions[endpoint]())
+        results[sub_id] = {"status": response.status_code, "body": response.get_json(silent=True)}
+    return fast_json(results)
 
 
 # =============================================================================
@@ -1605,9 +1282,14 @@ def main():
     if os.name == 'nt':
         webbrowser.open(f'http://localhost:{port}')
 
-    # Run Flask
+    # Run the server. Processing state lives in this process, so it must be a
+    # single process; waitress serves requests from a thread pool instead.
     try:
-        app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
+        if HAS_WAITRESS:
+            logger.info(f"Serving with waitress ({SERVER_THREADS} threads)")
+            waitress_serve(app, host='0.0.0.0', port=port, threads=SERVER_THREADS)
+        else:
+            app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
         print("\n\nServer stopped.")
@@ -1615,6 +1297,10 @@ def main():
         logger.error(f"Server error: {e}", exc_info=True)
         print(f"\n\nERROR: {e}")
         print("Check photo_manager_web.log for details")
+    finally:
+        shutdown_event.set()
+        # Let started deletions finish so no half-deleted group is left behind
+        _background_pool.shutdown(wait=True)
 
 
 if __name__ == "__main__":
@@ -11,29 +11,224 @@ Version: 2.1
 import os
 import json
 import hashlib
+import mmap
 import shutil
 import zipfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, List, Tuple, Optional, Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from collections import defaultdict
+from operator import attrgetter
 import subprocess
 import re
+import sqlite3
+import struct
+import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import logging
 
 
 # Try to import OpenCV for blur detection
 try:
     import cv2
-    import numpy as np
     OPENCV_AVAILABLE = True
 except ImportError:
     OPENCV_AVAILABLE = False
 
+# Without OpenCV, blur is scored with NumPy on Pillow-decoded images
+try:
+    import numpy as np
+    from PIL import Image
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: Numba compiles the NumPy fallback into a parallel native loop
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+BLUR_DETECTION_AVAILABLE = OPENCV_AVAILABLE or NUMPY_AVAILABLE
+
+# Optional: BLAKE3 hashes large inputs on all cores by itself
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Digests from different algorithms never match, so each keeps its own cache table
+HASH_CACHE_TABLE = "hashes_blake3" if BLAKE3_AVAILABLE else "hashes"
+
+
+def _new_content_hash():
+    """Hasher for duplicate detection; hexdigest()[:32] is its 128-bit digest"""
+    if BLAKE3_AVAILABLE:
+        return blake3(max_threads=blake3.AUTO)
+    return hashlib.blake2b(digest_size=16)
+
+
+def _laplacian_variance_numpy(gray) -> float:
+    """Variance of the 4-neighbour Laplacian over the image interior"""
+    lap = (gray[:-2, 1:-1] + gray[2:, 1:-1] + gray[1:-1, :-2] + gray[1:-1, 2:]
+           - 4 * gray[1:-1, 1:-1])
+    return float(lap.var(dtype=np.float64))
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _laplacian_variance_numba(gray) -> float:
+        """Same as _laplacian_variance_numpy in one pass, accumulating sum and sum of squares"""
+        rows, cols = gray.shape
+        total = 0.0
+        total_sq = 0.0
+        for i in prange(1, rows - 1):
+            for j in range(1, cols - 1):
+                value = (gray[i - 1, j] + gray[i + 1, j] + gray[i, j - 1] + gray[i, j + 1]
+                         - 4.0 * gray[i, j])
+                total += value
+                total_sq += value * value
+        count = (rows - 2) * (cols - 2)
+        mean = total / count
+        return total_sq / count - mean * mean
+
+
+def _laplacian_variance(gray) -> float:
+    """Blur score for a float32 grayscale array when OpenCV is not installed"""
+    if min(gray.shape) < 3:
+        return 0.0
+    if NUMBA_AVAILABLE:
+        return float(_laplacian_variance_numba(gray))
+    return _laplacian_variance_numpy(gray)
+
+
+def _burst_groups(seconds: List[float], threshold: float) -> List[List[int]]:
+    """Indices of capture times that form bursts, each burst in time order
+
+    A burst is a run of two or more times whose consecutive gaps are at most
+    threshold. The times need not be sorted.
+    """
+    if NUMPY_AVAILABLE:
+        times = np.fromiter(seconds, dtype=np.float64, count=len(seconds))
+        order = np.argsort(times, kind='stable')
+        starts = np.flatnonzero(np.diff(times[order]) > threshold) + 1
+        return [run.tolist() for run in np.split(order, starts) if len(run) > 1]
+
+    order = sorted(range(len(seconds)), key=seconds.__getitem__)
+    groups, run = [], order[:1]
+    for prev, i in zip(order, order[1:]):
+        if seconds[i] - seconds[prev] > threshold:
+            groups.append(run)
+            run = []
+        run.append(i)
+    groups.append(run)
+    return [run for run in groups if len(run) > 1]
+
+
+def _fadvise(f, advice: str):
+    """Pass a whole-file page cache hint (an os.POSIX_FADV_* name) where supported"""
+    if hasattr(os, "posix_fadvise") and hasattr(os, advice):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+
+def _prefetch(path: Path):
+    """Ask the kernel to start reading a file into the page cache in the background"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """Put a second name on src at dst, copying only when a hard link is impossible
+
+    Review folders hold copies while the originals stay put. On the same
+    filesystem a hard link gives that without moving any bytes; across
+    drives, or on filesystems without links (FAT, exFAT), it falls back to
+    copying with metadata.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
+def _fast_copy(src: Path, dst: Path):
+    """Copy a file with its timestamps, letting the OS move the bytes
+
+    Filesystems with copy-on-write clones share the data instead of copying
+    it. Otherwise, on Linux and macOS shutil.copy2 copies in the kernel, as does
+    Windows from Python 3.12. Older Pythons on Windows copy through a
+    Python buffer, so there CopyFileW does it instead; it keeps the
+    modification time like copy2.
+    """
+    if _reflink(src, dst):
+        return
+    if os.name == 'nt' and sys.version_info < (3, 12):
+        import ctypes
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+        return
+    shutil.copy2(src, dst)
+
+
+# ioctl request that shares src's extents with dst (Btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone of src at dst where the filesystem supports it
+
+    Returns False, leaving nothing at dst, when cloning is not possible so
+    the caller can copy the bytes instead.
+    """
+    if sys.platform.startswith('linux'):
+        import fcntl
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                except OSError:
+                    cloned = False
+                else:
+                    cloned = True
+        except OSError:
+            return False
+        if not cloned:
+            os.unlink(dst)
+            return False
+        shutil.copystat(src, dst)
+        return True
+    if sys.platform == 'darwin':
+        import ctypes
+        import ctypes.util
+        try:
+            clonefile = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True).clonefile
+        except (OSError, AttributeError):
+            return False
+        return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0  # APFS keeps times too
+    return False
+
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_LOG_HANDLER_LOCK = threading.Lock()
+
 
 @dataclass
 class ProcessingProgress:
@@ -111,6 +306,195 @@ class ProcessingIssue:
     description: str = ""
 
 
+# JPEG start-of-frame markers carry the image size; C4/C8/CC are other segments
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_HEADER_READ_SIZE = 64 * 1024
+
+
+def _jpeg_dimensions(f) -> Optional[Tuple[int, int]]:
+    """Walk JPEG segments up to the first SOF marker, seeking past everything else"""
+    if f.read(2) != b'\xff\xd8':
+        return None
+    for _ in range(256):
+        marker = f.read(2)
+        while len(marker) == 2 and marker[0] == 0xFF and marker[1] == 0xFF:
+            marker = marker[1:] + f.read(1)  # fill bytes
+        if len(marker) != 2 or marker[0] != 0xFF:
+            return None
+        length_bytes = f.read(2)
+        if len(length_bytes) != 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        if marker[1] in _JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) != 5:
+                return None
+            height, width = struct.unpack('>HH', frame[1:5])
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+    return None
+
+
+def _heif_dimensions(header: bytes) -> Optional[Tuple[int, int]]:
+    """Largest 'ispe' (image spatial extents) property; grid images also list their tiles"""
+    best = None
+    start = header.find(b'ispe')
+    while start >= 4 and start + 16 <= len(header):
+        width, height = struct.unpack('>II', header[start + 8:start + 16])
+        if best is None or width * height > best[0] * best[1]:
+            best = (width, height)
+        start = header.find(b'ispe', start + 4)
+    return best
+
+
+def _fast_dimensions(path: Path) -> Optional[Tuple[int, int]]:
+    """Read (width, height) straight from the file header for common image formats
+
+    Returns None when the format is not recognised, so the caller can fall
+    back to exiftool.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if path.suffix.lower() in ('.jpg', '.jpeg'):
+                return _jpeg_dimensions(f)
+            header = f.read(_HEADER_READ_SIZE)
+    except (OSError, struct.error):
+        return None
+
+    try:
+        if header.startswith(b'\x89PNG\r\n\x1a\n') and header[12:16] == b'IHDR':
+            return struct.unpack('>II', header[16:24])
+        if header[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', header[6:10])
+        if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+            chunk = header[12:16]
+            if chunk == b'VP8X':
+                width = int.from_bytes(header[24:27], 'little') + 1
+                height = int.from_bytes(header[27:30], 'little') + 1
+                return width, height
+            if chunk == b'VP8 ' and header[23:26] == b'\x9d\x01\x2a':
+                width, height = struct.unpack('<HH', header[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b'VP8L' and header[20] == 0x2F:
+                bits = int.from_bytes(header[21:25], 'little')
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            return None
+        if header[:2] == b'BM':
+            width, height = struct.unpack('<ii', header[18:26])
+            return width, abs(height)
+        if header[4:8] == b'ftyp':
+            return _heif_dimensions(header)
+    except (IndexError, struct.error):
+        return None
+    return None
+
+
+class ExifToolDaemon:
+    """One long-lived exiftool process driven through -stay_open
+
+    Starting exiftool costs a Perl interpreter and module load; keeping one
+    process open and feeding it argument lists on stdin pays that only once.
+    """
+
+    READY = "{ready}"
+
+    def __init__(self, exiftool_path: str):
+        self.exiftool_path = exiftool_path
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _ensure_started(self):
+        if self._process is not None and self._process.poll() is not None:
+            # Killed after a timeout; drop its pipes and start over
+            self._close_pipes(self._process)
+            self._process = None
+        if self._process is None:
+            self._process = subprocess.Popen(
+                [self.exiftool_path, '-stay_open', 'True', '-@', '-',
+                 '-common_args', '-charset', 'filename=utf8'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                errors='replace'
+            )
+
+    def execute(self, *args: str, timeout: Optional[float] = None) -> str:
+        """Run one exiftool command and return its stdout
+
+        The process is killed if it does not answer within timeout seconds;
+        the next call starts a fresh one.
+        """
+        if any('\n' in arg for arg in args):
+            raise ValueError("exiftool arguments cannot contain newlines")
+        with self._lock:
+            self._ensure_started()
+            process = self._process
+            process.stdin.write('\n'.join(args) + '\n-execute\n')
+            process.stdin.flush()
+
+            timer = threading.Timer(timeout, process.kill) if timeout else None
+            if timer:
+                timer.start()
+            try:
+                lines = []
+                for line in iter(process.stdout.readline, ''):
+                    if line.rstrip('\r\n') == self.READY:
+                        return ''.join(lines)
+                    lines.append(line)
+            finally:
+                if timer:
+                    timer.cancel()
+            raise RuntimeError("exiftool exited before answering")
+
+    def get_dimensions_batch(self, paths: List[Path],
+                             timeout: Optional[float] = None) -> List[Optional[Tuple[int, int]]]:
+        """Read (width, height) for many files in one command; None where unknown"""
+        names = [str(path) for path in paths if '\n' not in str(path)]
+        if not names:
+            return [None] * len(paths)
+        output = self.execute('-j', '-n', '-ImageWidth', '-ImageHeight', *names, timeout=timeout)
+        found = {}
+        for entry in json.loads(output) if output.strip() else []:
+            width, height = entry.get('ImageWidth'), entry.get('ImageHeight')
+            if isinstance(width, int) and isinstance(height, int):
+                source = os.path.normcase(os.path.normpath(entry.get('SourceFile', '')))
+                found[source] = (width, height)
+        return [found.get(os.path.normcase(os.path.normpath(str(path)))) for path in paths]
+
+    def close(self):
+        """Ask exiftool to exit, killing it if it does not"""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.poll() is None:
+                process.stdin.write('-stay_open\nFalse\n')
+                process.stdin.flush()
+                process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            self._close_pipes(process)
+
+    @staticmethod
+    def _close_pipes(process: subprocess.Popen):
+        for stream in (process.stdin, process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
 class PhotoProcessorEnhanced:
     """Enhanced processing engine with threading and advanced features"""
 
@@ -124,6 +508,26 @@ class PhotoProcessorEnhanced:
     BLUR_THRESHOLD = 100.0  # Laplacian variance threshold
     BURST_TIME_THRESHOLD = 10
 
+    # Files per exiftool command, and how long one command may take (seconds)
+    EXIFTOOL_BATCH_SIZE = 200
+    EXIFTOOL_BATCH_TIMEOUT = 120
+
+    # Queued work per pool thread; keeps memory flat however many files there are
+    IN_FLIGHT_PER_WORKER = 4
+
+    # Read size for content hashing (bytes)
+    HASH_CHUNK_SIZE = 1024 * 1024
+    # Blocks (or parts) hashed between cancellation checks
+    HASH_CANCEL_CHECK_BLOCKS = 16
+    # Files from this size up are hashed as HASH_PART_SIZE parts in parallel
+    LARGE_FILE_HASH_THRESHOLD = 64 * 1024 * 1024
+    HASH_PART_SIZE = 8 * 1024 * 1024
+    # Bytes read from each end of a file to rule out non-duplicates cheaply
+    PARTIAL_HASH_SIZE = 64 * 1024
+
+    # File handler of the most recent run's log; replaced by each new instance
+    _log_file_handler: Optional[logging.FileHandler] = None
+
 
     def __init__(self, base_path: str, exiftool_path: str = None, max_workers: int = 4):
         """
@@ -179,9 +583,15 @@ class PhotoProcessorEnhanced:
         self.progress_callback: Optional[Callable[[ProcessingProgress], None]] = None
         self.status_callback: Optional[Callable[[str], None]] = None
 
+        # Content hashes from earlier runs: path -> (size, mtime_ns, digest)
+        self.hash_cache_file = self.base_path / "logs" / "hash_cache.sqlite"
+        self._hash_cache: Dict[str, Tuple[int, int, str]] = {}
+        self._hash_cache_updates: List[Tuple[str, int, int, str]] = []
+        self._hash_cache_lock = threading.Lock()
+        self._hash_part_pool: Optional[ThreadPoolExecutor] = None
+
         # Cancellation support
-        self.cancelled = False
-        self.cancel_lock = threading.Lock()
+        self._cancel_event = threading.Event()
 
         # Logging
         self.setup_logging()
@@ -223,6 +633,8 @@ class PhotoProcessorEnhanced:
         # Check OpenCV
         if OPENCV_AVAILABLE:
             results['opencv'] = 'OK'
+        elif BLUR_DETECTION_AVAILABLE:
+            results['opencv'] = 'OK: OpenCV not available, using NumPy blur detection.'
         else:
             results['opencv'] = 'FAIL: OpenCV not available.'
 
@@ -251,27 +663,33 @@ class PhotoProcessorEnhanced:
 
         log_file = log_dir / f"processing_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+        # Console output when nothing (e.g. the web app) has configured logging yet;
+        # without handlers this never opens a file, so repeat calls cost nothing
+        if not logging.getLogger().handlers:
+            logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+        # Each run logs to its own file; the previous run's file is closed, not leaked
         self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.INFO)
+        handler = logging.FileHandler(log_file, delay=True)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        with _LOG_HANDLER_LOCK:
+            previous = PhotoProcessorEnhanced._log_file_handler
+            if previous is not None:
+                self.logger.removeHandler(previous)
+                previous.close()
+            self.logger.addHandler(handler)
+            PhotoProcessorEnhanced._log_file_handler = handler
         self.logger.info(f"PhotoProcessor initialized - OpenCV available: {OPENCV_AVAILABLE}")
 
     def cancel(self):
         """Request cancellation of current operation"""
-        with self.cancel_lock:
-            self.cancelled = True
-            self.logger.info("Cancellation requested")
+        self._cancel_event.set()
+        self.logger.info("Cancellation requested")
 
     def is_cancelled(self) -> bool:
         """Check if operation was cancelled"""
-        with self.cancel_lock:
-            return self.cancelled
+        return self._cancel_event.is_set()
 
     def _find_exiftool(self) -> Optional[str]:
         """Try to find exiftool in common locations"""
@@ -313,62 +731,206 @@ class PhotoProcessorEnhanced:
         """
         Detect blur using OpenCV Laplacian variance
 
+        Falls back to a NumPy (or Numba, if installed) Laplacian on a
+        Pillow-decoded image when OpenCV is not available.
+
         Returns:
             (is_blurry, blur_score) - Lower score means more blurry
         """
+        is_blurry, blur_score, _ = self._measure_blur(image_path)
+        return is_blurry, blur_score
+
+    def _measure_blur(self, image_path: Path) -> Tuple[bool, float, Optional[Tuple[int, int]]]:
+        """detect_blur_opencv, plus the (width, height) of the decoded image if it decoded"""
         if not OPENCV_AVAILABLE:
-            return False, 0.0
+            return self._detect_blur_numpy(image_path)
 
         try:
-            # Read image
-            image = cv2.imread(str(image_path))
-            if image is None:
-                return True, 0.0  # Corrupted
-
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            # Decode straight to luma; JPEGs skip chroma upsampling and color conversion
+            gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+            if gray is None:
+                return True, 0.0, None  # Corrupted
 
-            # Calculate Laplacian variance
-            laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+            # Laplacian variance; int16 holds every 8-bit response and vectorizes well
+            laplacian = cv2.Laplacian(gray, cv2.CV_16S, ksize=1)
+            _, stddev = cv2.meanStdDev(laplacian)
+            laplacian_var = float(stddev[0, 0]) ** 2
 
             # Lower variance = more blurry
             is_blurry = laplacian_var < self.BLUR_THRESHOLD
 
-            return is_blurry, float(laplacian_var)
+            return is_blurry, float(laplacian_var), (gray.shape[1], gray.shape[0])
 
         except Exception as e:
             self.logger.error(f"Error detecting blur for {image_path}: {e}")
-            return False, 0.0
+            return False, 0.0, None
+
+    def _detect_blur_numpy(self, image_path: Path) -> Tuple[bool, float, Optional[Tuple[int, int]]]:
+        """_measure_blur without OpenCV"""
+        if not NUMPY_AVAILABLE:
+            return False, 0.0, None
+
+        try:
+            with Image.open(image_path) as image:
+                gray = np.asarray(image.convert("L"), dtype=np.float32)
+        except OSError:
+            return True, 0.0, None  # Corrupted
+
+        try:
+            laplacian_var = _laplacian_variance(gray)
+            return laplacian_var < self.BLUR_THRESHOLD, laplacian_var, (gray.shape[1], gray.shape[0])
+        except Exception as e:
+            self.logger.error(f"Error detecting blur for {image_path}: {e}")
+            return False, 0.0, None
 
     def calculate_hashes_parallel(self):
-        """Calculate file hashes using thread pool"""
+        """Calculate file hashes using thread pool
+
+        Only files that share their size with another file can be duplicates,
+        so files with a unique size are never read. Larger files are then
+        compared on their first and last PARTIAL_HASH_SIZE bytes, and only
+        those that still collide are read in full. Files ruled out along the
+        way keep a hash of None.
+        """
         self._update_progress("Calculating file hashes (parallel)")
 
-        self.progress.total_files = len(self.all_files)
-        self.progress.start_time = datetime.now()
+        size_map = defaultdict(list)
+        for photo in self.all_files:
+            size_map[photo.size].append(photo)
+        candidates = [photo for group in size_map.values() if len(group) > 1 for photo in group]
 
-        def hash_file(photo: PhotoFile) -> Tuple[PhotoFile, Optional[str]]:
-            """Hash a single file"""
-            if self.is_cancelled():
-                return photo, None
-            try:
-                photo.hash = self._calculate_hash(photo.path)
-                return photo, photo.hash
-            except Exception as e:
-                self.logger.error(f"Error hashing {photo.path}: {e}")
-                return photo, None
+        self._load_hash_cache()
 
-        # Process in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(hash_file, photo): photo for photo in self.all_files}
+        # Large files are first compared on their ends; only collisions are read in full
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as part_pool:
+            candidates = self._filter_by_partial_hash(executor, candidates)
+            self.logger.info(f"Hashing {len(candidates)} of {len(self.all_files)} files that may be duplicates")
 
-            for future in as_completed(futures):
+            self.progress.total_files = len(candidates)
+            self.progress.files_processed = 0
+            self.progress.start_time = datetime.now()
+
+            def hash_file(photo: PhotoFile) -> Tuple[PhotoFile, Optional[str]]:
+                """Hash a single file"""
                 if self.is_cancelled():
-                    executor.shutdown(wait=False)
-                    break
+                    return photo, None
+                try:
+                    photo.hash = self._calculate_hash(photo.path)
+                    return photo, photo.hash
+                except Exception as e:
+                    self.logger.error(f"Error hashing {photo.path}: {e}")
+                    return photo, None
 
+            # Large files also split their parts across the second pool
+            self._hash_part_pool = part_pool
+            for photo, future in self._submit_bounded(executor, self.max_workers, hash_file,
+                                                      self._prefetched(candidates)):
                 photo, hash_val = future.result()
                 self._update_progress(files_delta=1)
+        self._hash_part_pool = None
+
+        self._save_hash_cache()
+
+    def _prefetched(self, photos: List[PhotoFile]) -> Iterator[PhotoFile]:
+        """Yield photos, starting kernel readahead on each as it is queued for hashing
+
+        _submit_bounded pulls items only as the window frees up, so the disk
+        is reading a few files ahead of the hashing threads. Large files
+        (mapped in parts) and files the hash cache already covers are skipped.
+        """
+        for photo in photos:
+            cached = self._hash_cache.get(str(photo.path))
+            if photo.size < self.LARGE_FILE_HASH_THRESHOLD and not (cached and cached[0] == photo.size):
+                _prefetch(photo.path)
+            yield photo
+
+    def _filter_by_partial_hash(self, executor: ThreadPoolExecutor,
+                                candidates: List[PhotoFile]) -> List[PhotoFile]:
+        """Drop large candidates whose (size, partial hash) is unique
+
+        Files up to twice PARTIAL_HASH_SIZE would be read whole either way, so
+        they are kept as they are. So are files the hash cache covers, and any
+        file sharing a size with one of them: the cached file's ends were never
+        read, so the partial hash can't rule the pair out.
+        """
+        cached_sizes = {photo.size for photo in candidates if self._is_hash_cached(photo.path)}
+        small = [photo for photo in candidates
+                 if photo.size <= 2 * self.PARTIAL_HASH_SIZE or photo.size in cached_sizes]
+        large = [photo for photo in candidates
+                 if photo.size > 2 * self.PARTIAL_HASH_SIZE and photo.size not in cached_sizes]
+        if not large:
+            return small
+
+        self.progress.total_files = len(large)
+        self.progress.files_processed = 0
+        self.progress.start_time = datetime.now()
+
+        partial_map = defaultdict(list)
+        for photo, future in self._submit_bounded(executor, self.max_workers,
+                                                  lambda p: self._calculate_partial_hash(p.path), large):
+            digest = future.result()
+            if digest:
+                partial_map[(photo.size, digest)].append(photo)
+            self._update_progress(files_delta=1)
+
+        return small + [photo for group in partial_map.values() if len(group) > 1 for photo in group]
+
+    def _is_hash_cached(self, file_path: Path) -> bool:
+        """Whether the hash cache entry for a file still matches its size and mtime"""
+        cached = self._hash_cache.get(str(file_path))
+        if not cached:
+            return False
+        try:
+            st = file_path.stat()
+        except OSError:
+            return False
+        return cached[:2] == (st.st_size, st.st_mtime_ns)
+
+    def _load_hash_cache(self):
+        """Load content hashes saved by earlier runs"""
+        self._hash_cache = {}
+        self._hash_cache_updates = []
+        if not self.hash_cache_file.exists():
+            return
+        try:
+            conn = sqlite3.connect(self.hash_cache_file)
+            try:
+                with conn:
+                    self._create_hash_cache_table(conn)
+                rows = conn.execute(f"SELECT path, size, mtime_ns, digest FROM {HASH_CACHE_TABLE}").fetchall()
+            finally:
+                conn.close()
+            self._hash_cache = {path: (size, mtime_ns, digest) for path, size, mtime_ns, digest in rows}
+            self.logger.info(f"Loaded {len(self._hash_cache)} cached file hashes")
+        except sqlite3.Error as e:
+            self.logger.warning(f"Ignoring unreadable hash cache {self.hash_cache_file}: {e}")
+
+    def _save_hash_cache(self):
+        """Store the hashes computed this run for the next one"""
+        with self._hash_cache_lock:
+            updates, self._hash_cache_updates = self._hash_cache_updates, []
+        if not updates:
+            return
+        try:
+            conn = sqlite3.connect(self.hash_cache_file)
+            try:
+                with conn:
+                    self._create_hash_cache_table(conn)
+                    conn.executemany(f"INSERT OR REPLACE INTO {HASH_CACHE_TABLE} VALUES (?, ?, ?, ?)", updates)
+            finally:
+                conn.close()
+            self.logger.info(f"Saved {len(updates)} file hashes to cache")
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not save hash cache {self.hash_cache_file}: {e}")
+
+    @staticmethod
+    def _create_hash_cache_table(conn: sqlite3.Connection):
+        """Create the cache table for the hash algorithm in use"""
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {HASH_CACHE_TABLE} "
+            "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT)"
+        )
 
     def assess_quality_parallel(self):
         """Assess photo quality with parallel processing and real blur detection"""
@@ -378,136 +940,249 @@ class PhotoProcessorEnhanced:
         self.progress.files_processed = 0
         self.progress.start_time = datetime.now()
 
-        def assess_photo(photo: PhotoFile) -> Tuple[PhotoFile, Optional[ProcessingIssue]]:
-            """Assess a single photo"""
+        self._read_dimensions([photo for photo in self.all_files
+                               if photo.size / 1024 >= self.MIN_FILE_SIZE_KB])
+
+        issues_found = []
+
+        def record(photo: PhotoFile, issue: Optional[ProcessingIssue]):
+            if issue:
+                issues_found.append(issue)
+                if issue.category == 'too_small':
+                    self.stats['too_small_found'] += 1
+                elif issue.category == 'blur_corrupt':
+                    if photo.is_blurry:
+                        self.stats['blurry_found'] += 1
+                    else:
+                        self.stats['corrupted_found'] += 1
+            self._update_progress(files_delta=1)
+
+        # Stage A: size and resolution need no further I/O, so they run inline
+        blur_candidates = []
+        for photo in self.all_files:
             if self.is_cancelled():
-                return photo, None
-
-            # Check file size
-            size_kb = photo.size / 1024
-            if size_kb < self.MIN_FILE_SIZE_KB:
-                issue = ProcessingIssue(
-                    category='too_small',
-                    files=[photo],
-                    description=f"File size only {size_kb:.1f} KB"
-                )
-                return photo, issue
-
-            # Get dimensions
-            try:
-                if self.exiftool_path:
-                    result = subprocess.run(
-                        [self.exiftool_path, '-ImageWidth', '-ImageHeight', '-s3', str(photo.path)],
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                        timeout=5
-                    )
-                    lines = result.stdout.strip().split('\n')
-                    if len(lines) >= 2 and lines[0].isdigit() and lines[1].isdigit():
-                        photo.width = int(lines[0])
-                        photo.height = int(lines[1])
-
-                        if photo.width * photo.height < self.MIN_RESOLUTION:
-                            issue = ProcessingIssue(
-                                category='too_small',
-                                files=[photo],
-                                description=f"Low resolution: {photo.width}x{photo.height}"
-                            )
-                            return photo, issue
-            except Exception as e:
-                self.logger.error(f"Error getting dimensions for {photo.path}: {e}")
-                photo.is_corrupted = True
-                issue = ProcessingIssue(
-                    category='blur_corrupt',
-                    files=[photo],
-                    description="Corrupted or unreadable file"
-                )
-                return photo, issue
-
-            # Blur detection with OpenCV
-            if OPENCV_AVAILABLE and photo.path.suffix.lower() in self.IMAGE_EXTENSIONS:
-                try:
-                    is_blurry, blur_score = self.detect_blur_opencv(photo.path)
-                    photo.is_blurry = is_blurry
-                    photo.blur_score = blur_score
+                break
+            issue = self._check_size(photo)
+            if not issue and BLUR_DETECTION_AVAILABLE and photo.path.suffix.lower() in self.IMAGE_EXTENSIONS:
+                blur_candidates.append(photo)
+            else:
+                record(photo, issue)
+
+        # Stage B: blur detection (OpenCV, or the NumPy fallback). Decoding and
+        # filtering release the GIL, so one thread per core keeps every core busy.
+        def score_blur(photo: PhotoFile) -> Tuple[bool, float, Optional[Tuple[int, int]]]:
+            return self._measure_blur(photo.path)
 
-                    if is_blurry:
+        blur_workers = max(self.max_workers, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=blur_workers) as executor:
+            for photo, future in self._submit_bounded(executor, blur_workers, score_blur, blur_candidates):
+                issue = None
+                try:
+                    photo.is_blurry, photo.blur_score, dimensions = future.result()
+                    if dimensions and not (photo.width and photo.height):
+                        # Header unreadable: the decode gave the size, so check resolution now
+                        photo.width, photo.height = dimensions
+                        issue = self._check_size(photo)
+                    if not issue and photo.is_blurry:
                         issue = ProcessingIssue(
                             category='blur_corrupt',
                             files=[photo],
-                            description=f"Blurry (score: {blur_score:.1f})"
+                            description=f"Blurry (score: {photo.blur_score:.1f})"
                         )
-                        return photo, issue
                 except Exception as e:
                     self.logger.error(f"Error detecting blur for {photo.path}: {e}")
+                record(photo, issue)
 
-            return photo, None
+        # Add issues to main list
+        self.issues.extend(issues_found)
 
-        # Process in parallel
-        issues_found = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(assess_photo, photo): photo for photo in self.all_files}
+    def _submit_bounded(self, executor: ThreadPoolExecutor, workers: int,
+                        fn: Callable, items: Iterable) -> Iterator[Tuple[object, Future]]:
+        """Yield (item, future) as fn(item) calls finish, with few futures alive at once
 
-            for future in as_completed(futures):
-                if self.is_cancelled():
-                    executor.shutdown(wait=False)
-                    break
+        At most IN_FLIGHT_PER_WORKER * workers calls are queued; a new item is
+        submitted only when one finishes, so memory stays flat for any library
+        size. After cancellation nothing new is submitted and the calls already
+        running drain.
+        """
+        items = iter(items)
+        exhausted = object()
+        pending: Dict[Future, object] = {}
+
+        def fill():
+            while len(pending) < self.IN_FLIGHT_PER_WORKER * workers and not self.is_cancelled():
+                item = next(items, exhausted)
+                if item is exhausted:
+                    return
+                pending[executor.submit(fn, item)] = item
+
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+            fill()
+
+    def _check_size(self, photo: PhotoFile) -> Optional[ProcessingIssue]:
+        """Flag a photo whose file size or resolution is too small"""
+        size_kb = photo.size / 1024
+        if size_kb < self.MIN_FILE_SIZE_KB:
+            return ProcessingIssue(
+                category='too_small',
+                files=[photo],
+                description=f"File size only {size_kb:.1f} KB"
+            )
 
-                photo, issue = future.result()
-                if issue:
-                    issues_found.append(issue)
-                    if issue.category == 'too_small':
-                        self.stats['too_small_found'] += 1
-                    elif issue.category == 'blur_corrupt':
-                        if photo.is_blurry:
-                            self.stats['blurry_found'] += 1
-                        else:
-                            self.stats['corrupted_found'] += 1
+        # Dimensions were read up front by _read_dimensions
+        if photo.width and photo.height and photo.width * photo.height < self.MIN_RESOLUTION:
+            return ProcessingIssue(
+                category='too_small',
+                files=[photo],
+                description=f"Low resolution: {photo.width}x{photo.height}"
+            )
+        return None
 
-                self._update_progress(files_delta=1)
+    def _read_dimensions(self, photos: List[PhotoFile]):
+        """Fill in width/height from image headers, asking exiftool only about the rest
 
-        # Add issues to main list
-        self.issues.extend(issues_found)
+        Images whose header is not recognised are left to the blur pass,
+        which decodes them anyway and takes their size from the pixels. The
+        rest (videos, or images when blur detection is unavailable) go
+        through one exiftool process, EXIFTOOL_BATCH_SIZE files at a time.
+        """
+        unknown = []
+        for photo in photos:
+            is_image = photo.path.suffix.lower() in self.IMAGE_EXTENSIONS
+            dimensions = _fast_dimensions(photo.path) if is_image else None
+            if dimensions:
+                photo.width, photo.height = dimensions
+            elif not (is_image and BLUR_DETECTION_AVAILABLE):
+                unknown.append(photo)
+        photos = unknown
+        if not self.exiftool_path or not photos:
+            return
+        try:
+            with ExifToolDaemon(self.exiftool_path) as exiftool:
+                for start in range(0, len(photos), self.EXIFTOOL_BATCH_SIZE):
+                    if self.is_cancelled():
+                        break
+                    batch = photos[start:start + self.EXIFTOOL_BATCH_SIZE]
+                    try:
+                        sizes = exiftool.get_dimensions_batch(
+                            [photo.path for photo in batch], timeout=self.EXIFTOOL_BATCH_TIMEOUT)
+                    except (BrokenPipeError, RuntimeError, ValueError) as e:
+                        self.logger.error(f"Error getting dimensions for {len(batch)} files: {e}")
+                        continue
+                    for photo, dimensions in zip(batch, sizes):
+                        if dimensions:
+                            photo.width, photo.height = dimensions
+        except OSError as e:
+            self.logger.error(f"Could not run exiftool for dimensions: {e}")
 
     def _calculate_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of a file"""
-        sha256_hash = hashlib.sha256()
+        """Calculate the 128-bit BLAKE3 (if installed) or BLAKE2b content hash of a file
+
+        Only used to compare files for equality, so a fast non-SHA hash is fine.
+        A file whose size and mtime match the hash cache is not read again.
+        Returns "" on error, or when cancelled partway through the file.
+        """
+        file_hash = _new_content_hash()
         try:
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(8192), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            st = file_path.stat()
+            key = str(file_path)
+            cached = self._hash_cache.get(key)
+            if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+                return cached[2]
+
+            with open(file_path, "rb", buffering=0) as f:
+                _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+                try:
+                    if st.st_size >= self.LARGE_FILE_HASH_THRESHOLD:
+                        digest = self._calculate_hash_parts(f)
+                    else:
+                        # Read into one reused buffer rather than allocating a bytes object per block
+                        buffer = bytearray(self.HASH_CHUNK_SIZE)
+                        with memoryview(buffer) as view:
+                            for i, n in enumerate(iter(lambda: f.readinto(buffer), 0)):
+                                if i % self.HASH_CANCEL_CHECK_BLOCKS == 0 and self.is_cancelled():
+                                    return ""
+                                file_hash.update(view[:n])
+                        digest = file_hash.hexdigest()[:32]
+                finally:
+                    # Images are decoded again for blur detection, so only videos leave the page cache
+                    if file_path.suffix.lower() not in self.IMAGE_EXTENSIONS:
+                        _fadvise(f, "POSIX_FADV_DONTNEED")
+            if not digest:
+                return ""
+            with self._hash_cache_lock:
+                self._hash_cache_updates.append((key, st.st_size, st.st_mtime_ns, digest))
+            return digest
         except Exception as e:
             self.logger.error(f"Error calculating hash for {file_path}: {e}")
             return ""
     
-    def _select_best_photo(self, photos: List[PhotoFile]) -> PhotoFile:
-        """Select the best photo with blur score consideration"""
-        for photo in photos:
-            score = 0.0
-
-            # File size
-            score += photo.size / 1024 / 1024
+    def _calculate_partial_hash(self, file_path: Path) -> str:
+        """Hash the first and last PARTIAL_HASH_SIZE bytes of a file, or "" on error"""
+        try:
+            with open(file_path, "rb") as f:
+                head = f.read(self.PARTIAL_HASH_SIZE)
+                f.seek(-self.PARTIAL_HASH_SIZE, os.SEEK_END)
+                tail = f.read(self.PARTIAL_HASH_SIZE)
+            return hashlib.blake2b(head + tail, digest_size=16).hexdigest()
+        except OSError as e:
+            self.logger.error(f"Error reading {file_path}: {e}")
+            return ""
 
-            # Resolution
-            score += (photo.width * photo.height) / 1000000
+    def _calculate_hash_parts(self, f) -> str:
+        """Hash a large open file as HASH_PART_SIZE parts in parallel, then hash the part digests
 
-            # Blur score (if available)
-            if photo.blur_score is not None:
-                score += photo.blur_score / 100  # Normalize
+        hashlib releases the GIL while hashing, so parts use several cores. The
+        result differs from a plain BLAKE2b of the file, which is fine: files of
+        the same size always take the same path, and digests are only compared.
+        BLAKE3 spreads each part over the cores itself, so it hashes the parts
+        in order into one digest.
+        """
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            if BLAKE3_AVAILABLE:
+                file_hash = _new_content_hash()
+                for i in range(0, len(view), self.HASH_PART_SIZE):
+                    if self.is_cancelled():
+                        return ""
+                    with view[i:i + self.HASH_PART_SIZE] as part:
+                        file_hash.update(part)
+                return file_hash.hexdigest()[:32]
 
-            # Has JSON
-            if photo.has_json:
-                score += 10
+            def hash_part(part: memoryview) -> bytes:
+                if self.is_cancelled():
+                    return b""
+                return hashlib.blake2b(part, digest_size=16).digest()
 
-            # Not blurry
-            if not photo.is_blurry:
-                score += 5
+            parts = [view[i:i + self.HASH_PART_SIZE] for i in range(0, len(view), self.HASH_PART_SIZE)]
+            try:
+                mapper = self._hash_part_pool.map if self._hash_part_pool else map
+                digests = list(mapper(hash_part, parts))
+            finally:
+                for part in parts:
+                    part.release()
+        if self.is_cancelled():
+            return ""
+        return hashlib.blake2b(b"".join(digests), digest_size=16).hexdigest()
 
-            photo.quality_score = score
+    def _select_best_photo(self, photos: List[PhotoFile]) -> PhotoFile:
+        """Select the best photo with blur score consideration"""
+        for photo in photos:
+            photo.quality_score = (
+                photo.size / 1048576                           # File size in MB
+                + photo.width * photo.height / 1000000         # Resolution in MP
+                + (photo.blur_score or 0.0) / 100              # Sharpness, normalized
+                + (10 if photo.has_json else 0)                # Has JSON
+                + (0 if photo.is_blurry else 5)                # Not blurry
+            )
 
-        return max(photos, key=lambda p: p.quality_score)
+        return max(photos, key=attrgetter('quality_score'))
 
     def run_full_pipeline(self):
         """Run the complete enhanced processing pipeline"""
@@ -605,8 +1280,9 @@ class PhotoProcessorEnhanced:
                 extract_dir.mkdir(exist_ok=True)
 
                 # Extract the zip file
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_dir)
+                self._extract_zip(zip_path, extract_dir)
+                if self.is_cancelled():
+                    break
 
                 extracted_count += 1
                 self.logger.info(f"Successfully extracted {zip_path.name}")
@@ -623,6 +1299,73 @@ class PhotoProcessorEnhanced:
         return extracted_count
 
 
+    def _extract_zip(self, zip_path: Path, extract_dir: Path):
+        """Extract an archive with one ZipFile per worker thread
+
+        A ZipFile handle is not safe to share between threads, but members
+        decompress independently, so each worker opens the archive itself and
+        extracts its own share. Members already on disk with the right size
+        (from an interrupted earlier run) are skipped.
+        """
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            infos = zip_ref.infolist()
+
+        # ZipFile.extract creates missing folders without exist_ok, so workers
+        # extracting into one album would race; make every folder here first
+        folders = {extract_dir}
+        members = []
+        for member in infos:
+            target = self._member_target(member, extract_dir)
+            if member.is_dir():
+                folders.add(target)
+            elif not self._already_extracted(member, target):
+                folders.add(target.parent)
+                members.append(member)
+        for folder in folders:
+            folder.mkdir(parents=True, exist_ok=True)
+        if not members:
+            return
+
+        # Deal members largest first, round-robin, so workers get similar amounts of data
+        members.sort(key=lambda member: member.file_size, reverse=True)
+        workers = min(self.max_workers, len(members))
+
+        def extract_share(share: List[zipfile.ZipInfo]):
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                for member in share:
+                    if self.is_cancelled():
+                        return
+                    zip_ref.extract(member, extract_dir)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(extract_share, members[i::workers]) for i in range(workers)]
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def _member_target(member: zipfile.ZipInfo, extract_dir: Path) -> Path:
+        """Where ZipFile.extract puts a member: drive, empty, '.' and '..' parts are dropped
+
+        On Windows the name is also sanitized the way extract() does it, so an
+        album like "Trip: Paris" maps to the "Trip_ Paris" folder it really uses.
+        """
+        name = member.filename.replace('/', os.sep)
+        if os.altsep:
+            name = name.replace(os.altsep, os.sep)
+        name = os.path.splitdrive(name)[1]
+        name = os.sep.join(part for part in name.split(os.sep) if part not in ('', '.', '..'))
+        if os.sep == '\\':
+            name = zipfile.ZipFile._sanitize_windows_name(name, os.sep)
+        return extract_dir.joinpath(*name.split(os.sep)) if name else extract_dir
+
+    @staticmethod
+    def _already_extracted(member: zipfile.ZipInfo, target: Path) -> bool:
+        """Whether a member is already on disk at target with its full size"""
+        try:
+            return target.stat().st_size == member.file_size
+        except (OSError, ValueError):
+            return False
+
     def scan_files(self):
         """
         Scan all relevant directories for photo/video files and associated JSON metadata.
@@ -646,33 +1389,56 @@ class PhotoProcessorEnhanced:
                 
             self.logger.info(f"Scanning directory: {scan_dir}")
             
-            for root, dirs, files in os.walk(scan_dir):
-                if self.is_cancelled():
-                    break
-                    
-                for filename in files:
-                    if self.is_cancelled():
-                        break
-                        
-                    file_path = Path(root) / filename
-                    file_ext = file_path.suffix.lower()
-                    
-                    # Check if it's a media file
-                    if file_ext in self.IMAGE_EXTENSIONS or file_ext in self.VIDEO_EXTENSIONS:
-                        photo = PhotoFile(path=file_path)
-                        
-                        # Check for associated JSON metadata file
-                        json_path = file_path.parent / f"{file_path.name}.json"
-                        if json_path.exists():
-                            photo.has_json = True
-                            photo.json_path = json_path
-                        
-                        self.all_files.append(photo)
-                        self._update_progress(files_delta=1)
+            for photo in self._scan_directory(scan_dir):
+                self.all_files.append(photo)
+                self._update_progress(files_delta=1)
         
         self.logger.info(f"Found {len(self.all_files)} media files")
         self.stats['total_processed'] = len(self.all_files)
 
+    def _scan_directory(self, top: Path) -> Iterator[PhotoFile]:
+        """Yield a PhotoFile for every media file under top, top-down like os.walk
+
+        One scandir per directory supplies names and sizes, and the sidecar
+        check is a set lookup rather than a stat per file.
+        """
+        media_extensions = self.IMAGE_EXTENSIONS | self.VIDEO_EXTENSIONS
+        stack = [str(top)]
+        while stack and not self.is_cancelled():
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                self.logger.warning(f"Cannot scan {directory}: {e}")
+                continue
+
+            names = {os.path.normcase(entry.name) for entry in entries}
+            subdirs = []
+            for entry in entries:
+                if self.is_cancelled():
+                    return
+                try:
+                    if entry.is_dir():
+                        # Like os.walk, symlinked directories are not followed
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() not in media_extensions:
+                        continue
+                    photo = PhotoFile(path=Path(entry.path), size=entry.stat().st_size)
+                except OSError as e:
+                    self.logger.warning(f"Cannot read {entry.path}: {e}")
+                    continue
+
+                # Check for associated JSON metadata file
+                json_name = f"{entry.name}.json"
+                if os.path.normcase(json_name) in names:
+                    photo.has_json = True
+                    photo.json_path = Path(directory, json_name)
+                yield photo
+            stack.extend(reversed(subdirs))
+
     def restore_metadata(self):
         """
         Restore/correct file timestamps and metadata using JSON sidecars and exiftool.
@@ -686,58 +1452,60 @@ class PhotoProcessorEnhanced:
         self.progress.total_files = len(files_with_json)
         self.progress.files_processed = 0
         
-        for photo in files_with_json:
-            if self.is_cancelled():
-                break
+        # One exiftool process for every write, started on first use
+        exiftool = ExifToolDaemon(self.exiftool_path) if self.exiftool_path else None
+        try:
+            for photo in files_with_json:
+                if self.is_cancelled():
+                    break
                 
-            try:
-                # Read JSON metadata
-                with open(photo.json_path, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+                try:
+                    # Read JSON metadata
+                    with open(photo.json_path, 'r', encoding='utf-8') as f:
+                        metadata = json.load(f)
                 
-                # Extract date taken from JSON
-                date_taken = None
-                if 'photoTakenTime' in metadata:
-                    timestamp = metadata['photoTakenTime'].get('timestamp')
-                    if timestamp:
-                        date_taken = datetime.fromtimestamp(int(timestamp))
-                elif 'creationTime' in metadata:
-                    timestamp = metadata['creationTime'].get('timestamp')
-                    if timestamp:
-                        date_taken = datetime.fromtimestamp(int(timestamp))
+                    # Extract date taken from JSON
+                    date_taken = None
+                    if 'photoTakenTime' in metadata:
+                        timestamp = metadata['photoTakenTime'].get('timestamp')
+                        if timestamp:
+                            date_taken = datetime.fromtimestamp(int(timestamp))
+                    elif 'creationTime' in metadata:
+                        timestamp = metadata['creationTime'].get('timestamp')
+                        if timestamp:
+                            date_taken = datetime.fromtimestamp(int(timestamp))
                 
-                if date_taken:
-                    photo.date_taken = date_taken
+                    if date_taken:
+                        photo.date_taken = date_taken
                     
-                    # Update file timestamps
-                    timestamp = date_taken.timestamp()
-                    os.utime(photo.path, (timestamp, timestamp))
+                        # Update file timestamps
+                        timestamp = date_taken.timestamp()
+                        os.utime(photo.path, (timestamp, timestamp))
                     
-                    # Use exiftool to write EXIF data if available
-                    if self.exiftool_path:
-                        try:
-                            date_str = date_taken.strftime('%Y:%m:%d %H:%M:%S')
-                            subprocess.run(
-                                [self.exiftool_path, f'-DateTimeOriginal={date_str}',
-                                 '-overwrite_original', str(photo.path)],
-                                capture_output=True,
-                                timeout=10,
-                                check=False
-                            )
-                        except Exception as e:
-                            self.logger.warning(f"Failed to write EXIF for {photo.path}: {e}")
+                        # Use exiftool to write EXIF data if available
+                        if exiftool:
+                            try:
+                                date_str = date_taken.strftime('%Y:%m:%d %H:%M:%S')
+                                # -P keeps the mtime set above, so the hash cache still matches next run
+                                exiftool.execute(f'-DateTimeOriginal={date_str}', '-P',
+                                                 '-overwrite_original', str(photo.path), timeout=10)
+                            except Exception as e:
+                                self.logger.warning(f"Failed to write EXIF for {photo.path}: {e}")
                 
-                self._update_progress(files_delta=1)
+                    self._update_progress(files_delta=1)
                 
-            except Exception as e:
-                self.logger.error(f"Failed to restore metadata for {photo.path}: {e}")
-        
+                except Exception as e:
+                    self.logger.error(f"Failed to restore metadata for {photo.path}: {e}")
+        finally:
+            if exiftool:
+                exiftool.close()
+
         self.logger.info(f"Restored metadata for {self.progress.files_processed} files")
 
     def find_duplicates(self):
         """
         Detect duplicate files by hash and group them.
-        - Build a hash-to-PhotoFile mapping.
+        - Build a (size, hash)-to-PhotoFile mapping; files with a unique size were never hashed.
         - For each group with >1 file, create a ProcessingIssue (category='duplicates').
         - Use _select_best_photo to recommend which to keep.
         - Update stats and self.issues.
@@ -748,14 +1516,14 @@ class PhotoProcessorEnhanced:
         hash_map = defaultdict(list)
         for photo in self.all_files:
             if photo.hash:
-                hash_map[photo.hash].append(photo)
+                hash_map[(photo.size, photo.hash)].append(photo)
         
         # Find duplicates
         duplicate_groups = {h: photos for h, photos in hash_map.items() if len(photos) > 1}
         
         self.logger.info(f"Found {len(duplicate_groups)} duplicate groups")
         
-        for file_hash, photos in duplicate_groups.items():
+        for (size, file_hash), photos in duplicate_groups.items():
             if self.is_cancelled():
                 break
                 
@@ -786,32 +1554,14 @@ class PhotoProcessorEnhanced:
         
         # Filter files with valid date_taken
         dated_files = [f for f in self.all_files if f.date_taken and not f.is_corrupted]
-        dated_files.sort(key=lambda x: x.date_taken)
         
-        # Group bursts
+        # Sort and window one column of offsets, so no datetimes are compared
         burst_groups = []
-        current_burst = []
-        
-        for i, photo in enumerate(dated_files):
-            if self.is_cancelled():
-                break
-                
-            if not current_burst:
-                current_burst.append(photo)
-            else:
-                time_diff = (photo.date_taken - current_burst[-1].date_taken).total_seconds()
-                
-                if time_diff <= self.BURST_TIME_THRESHOLD:
-                    current_burst.append(photo)
-                else:
-                    # Save burst if it has multiple photos
-                    if len(current_burst) > 1:
-                        burst_groups.append(current_burst)
-                    current_burst = [photo]
-        
-        # Don't forget last burst
-        if len(current_burst) > 1:
-            burst_groups.append(current_burst)
+        if dated_files:
+            first = dated_files[0].date_taken
+            seconds = [(f.date_taken - first).total_seconds() for f in dated_files]
+            burst_groups = [[dated_files[i] for i in run]
+                            for run in _burst_groups(seconds, self.BURST_TIME_THRESHOLD)]
         
         self.logger.info(f"Found {len(burst_groups)} burst photo groups")
         
@@ -842,57 +1592,42 @@ class PhotoProcessorEnhanced:
         """
         self._update_progress("Organizing files")
         
-        # Build set of files that need review
-        review_files = set()
+        # Map each file that needs review to its folder; the first issue that flags it wins
+        review_dest: Dict[Path, Optional[Path]] = {}
         for issue in self.issues:
+            dest_dir = self.review_dirs.get(issue.category)
             for photo in issue.files:
                 # Don't move the recommended keeper to review
                 if issue.recommended_keep and photo.path == issue.recommended_keep.path:
                     continue
-                review_files.add(photo.path)
+                review_dest.setdefault(photo.path, dest_dir)
         
         self.progress.total_files = len(self.all_files)
         self.progress.files_processed = 0
         
+        # Pick every destination up front, so the threads below never race for a name.
+        # Each folder is created and listed once; names are then checked in memory.
+        plans: List[Tuple[PhotoFile, Path, bool]] = []
+        folder_names: Dict[Path, set] = {}
+
+        def names_in(folder: Path) -> set:
+            if folder not in folder_names:
+                folder.mkdir(parents=True, exist_ok=True)
+                with os.scandir(folder) as entries:
+                    folder_names[folder] = {entry.name.casefold() for entry in entries}
+            return folder_names[folder]
+
         for photo in self.all_files:
             if self.is_cancelled():
                 break
                 
             try:
                 # Determine destination
-                if photo.path in review_files:
-                    # Find which review folder
-                    dest_dir = None
-                    for issue in self.issues:
-                        if photo in issue.files:
-                            if issue.category == 'too_small':
-                                dest_dir = self.review_dirs['too_small']
-                            elif issue.category == 'blur_corrupt':
-                                dest_dir = self.review_dirs['blur_corrupt']
-                            elif issue.category == 'duplicates':
-                                dest_dir = self.review_dirs['duplicates']
-                            elif issue.category == 'burst':
-                                dest_dir = self.review_dirs['burst']
-                            break
-                    
+                if photo.path in review_dest:
+                    dest_dir = review_dest[photo.path]
                     if dest_dir:
-                        dest_path = dest_dir / photo.path.name
-                        # Handle name conflicts
-                        counter = 1
-                        while dest_path.exists():
-                            stem = photo.path.stem
-                            suffix = photo.path.suffix
-                            dest_path = dest_dir / f"{stem}_{counter}{suffix}"
-                            counter += 1
-                        
-                        shutil.copy2(photo.path, dest_path)
-                        
-                        # Also copy JSON if present
-                        if photo.has_json and photo.json_path and photo.json_path.exists():
-                            json_dest = dest_path.parent / f"{dest_path.name}.json"
-                            shutil.copy2(photo.json_path, json_dest)
-                        
-                        self.logger.info(f"Moved to review: {photo.path.name} -> {dest_dir.name}")
+                        plans.append((photo, self._claim_name(dest_dir, photo.path, names_in(dest_dir)), True))
+                        continue
                 else:
                     # Move to main library organized by date
                     if photo.date_taken:
@@ -901,36 +1636,67 @@ class PhotoProcessorEnhanced:
                     else:
                         dest_dir = self.photos_videos_dir / "Unknown Date"
                     
-                    dest_dir.mkdir(parents=True, exist_ok=True)
-                    dest_path = dest_dir / photo.path.name
-                    
-                    # Handle name conflicts
-                    counter = 1
-                    while dest_path.exists():
-                        stem = photo.path.stem
-                        suffix = photo.path.suffix
-                        dest_path = dest_dir / f"{stem}_{counter}{suffix}"
-                        counter += 1
-                    
                     # Only move if not already in destination
                     if photo.path.parent != dest_dir:
-                        shutil.move(str(photo.path), str(dest_path))
-                        
-                        # Also move JSON if present
-                        if photo.has_json and photo.json_path and photo.json_path.exists():
-                            json_dest = dest_path.parent / f"{dest_path.name}.json"
-                            shutil.move(str(photo.json_path), str(json_dest))
-                        
-                        self.stats['moved_to_library'] += 1
-                        self.logger.debug(f"Moved to library: {photo.path.name} -> {dest_dir}")
+                        plans.append((photo, self._claim_name(dest_dir, photo.path, names_in(dest_dir)), False))
+                        continue
                 
                 self._update_progress(files_delta=1)
                 
             except Exception as e:
                 self.logger.error(f"Failed to organize {photo.path}: {e}")
         
+        # Copying and moving wait on the disk, not the CPU, so they run in parallel
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for (photo, dest_path, to_review), future in self._submit_bounded(
+                    executor, self.max_workers, lambda plan: self._organize_one(*plan), plans):
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to organize {photo.path}: {e}")
+                    continue
+                if not to_review:
+                    self.stats['moved_to_library'] += 1
+                self._update_progress(files_delta=1)
+        
         self.logger.info(f"Organized {self.progress.files_processed} files")
 
+    @staticmethod
+    def _claim_name(dest_dir: Path, src: Path, taken: set) -> Path:
+        """Free path for src in dest_dir, adding _1, _2... on conflicts, and mark it taken
+
+        taken holds the casefolded names in dest_dir, so a name differing only
+        in case is treated as a conflict, as it is on Windows and macOS.
+        """
+        dest_path = dest_dir / src.name
+        counter = 1
+        while dest_path.name.casefold() in taken:
+            dest_path = dest_dir / f"{src.stem}_{counter}{src.suffix}"
+            counter += 1
+        taken.add(dest_path.name.casefold())
+        return dest_path
+
+    def _organize_one(self, photo: PhotoFile, dest_path: Path, to_review: bool):
+        """Put a photo (and its JSON sidecar) at dest_path: linked into review, or moved to the library"""
+        has_json = photo.has_json and photo.json_path and photo.json_path.exists()
+        json_dest = dest_path.parent / f"{dest_path.name}.json"
+        if to_review:
+            _link_or_copy(photo.path, dest_path)
+            
+            # Also copy JSON if present
+            if has_json:
+                _link_or_copy(photo.json_path, json_dest)
+            
+            self.logger.info(f"Moved to review: {photo.path.name} -> {dest_path.parent.name}")
+        else:
+            shutil.move(str(photo.path), str(dest_path))
+            
+            # Also move JSON if present
+            if has_json:
+                shutil.move(str(photo.json_path), str(json_dest))
+            
+            self.logger.debug(f"Moved to library: {photo.path.name} -> {dest_path.parent}")
+
     def process(self):
         """
         Main entry point for the processing pipeline (for CLI and GUI).
@@ -1047,5 +1813,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -0,0 +1,211 @@
+// Google Photos Manager - Web Edition home page script
+
+// Cached DOM nodes (the script is deferred, so the document is already parsed)
+const els = {
+    status: document.getElementById('status-text'),
+    fill: document.getElementById('progress-fill'),
+    progText: document.getElementById('progress-text'),
+    progSection: document.getElementById('progress-section'),
+    log: document.getElementById('log-container'),
+    badge: document.getElementById('status-badge'),
+    btn: document.getElementById('btn-process')
+};
+// Older log lines are dropped past this many, to keep layout cheap on long runs
+const LOG_MAX_NODES = 500;
+let logStart = -1;
+let lastSeq = 0;
+let wasProcessing = false;
+let lastStatusKey = '';
+let statusStream = null;
+
+// Tab switching
+function showTab(tabName, tab) {
+    document.querySelectorAll('.tab-content').forEach(t => t.classList.remove('active'));
+    document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+    document.getElementById('tab-' + tabName).classList.add('active');
+    tab.classList.add('active');
+}
+
+// Toast notifications
+function showToast(message) {
+    const toast = document.getElementById('toast');
+    toast.textContent = message;
+    toast.classList.add('show');
+    setTimeout(() => toast.classList.remove('show'), 3000);
+}
+
+// Fill in settings from the data inlined into the page
+function loadSettings() {
+    const boot = window.__BOOT__ || {};
+    document.getElementById('base-path').value = boot.base_path || '';
+    document.getElementById('takeout-path').textContent = boot.base_path + '/GoogleTakeout/';
+}
+
+// Save settings
+async function saveSettings() {
+    const basePath = document.getElementById('base-path').value;
+    try {
+        await fetch('/api/settings', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({base_path: basePath})
+        });
+        showToast('Settings saved! ✓');
+        document.getElementById('takeout-path').textContent = basePath + '/GoogleTakeout/';
+    } catch (e) {
+        showToast('Failed to save settings');
+    }
+}
+
+// Start processing
+async function startProcessing() {
+    if (els.btn.disabled) return;
+
+    if (!confirm('This will organize all photos in your GoogleTakeout folder.\n\nContinue?')) {
+        return;
+    }
+
+    els.btn.disabled = true;
+    els.progSection.classList.remove('hidden');
+    els.badge.classList.add('processing');
+
+    try {
+        await fetch('/api/process', {method: 'POST'});
+        openStatusStream();
+    } catch (e) {
+        showToast('Failed to start processing');
+        els.btn.disabled = false;
+    }
+}
+
+// Append only the log lines we have not rendered yet, as text nodes
+function renderLog(status) {
+    if (status.log_start !== logStart || status.log_seq < lastSeq) {
+        logStart = status.log_start;
+        lastSeq = status.log_start;
+        els.log.textContent = '';
+    }
+    const lines = status.log_new.slice(Math.max(0, lastSeq - status.log_from));
+    lastSeq = status.log_seq;
+    if (lines.length === 0) return;
+
+    const frag = document.createDocumentFragment();
+    for (const line of lines) {
+        const div = document.createElement('div');
+        div.textContent = line;
+        frag.appendChild(div);
+    }
+    els.log.appendChild(frag);
+    while (els.log.childElementCount > LOG_MAX_NODES) {
+        els.log.firstElementChild.remove();
+    }
+    els.log.scrollTop = els.log.scrollHeight;
+}
+
+// Apply a status snapshot pushed by the server
+function updateUI(status) {
+    // A reconnect resends the current snapshot; skip it if nothing moved
+    const key = [status.status, status.progress, status.is_processing,
+                 status.log_start, status.log_seq].join('|');
+    if (key === lastStatusKey) return;
+    lastStatusKey = key;
+
+    els.status.textContent = status.status;
+    els.fill.style.width = status.progress + '%';
+    els.progText.textContent = status.status;
+    renderLog(status);
+
+    if (status.is_processing) {
+        els.btn.disabled = true;
+        els.progSection.classList.remove('hidden');
+        els.badge.classList.add('processing');
+    } else {
+        els.btn.disabled = false;
+        els.badge.classList.remove('processing');
+        if (wasProcessing && status.progress >= 100) {
+            showToast('Done! Your photos are organized! 🎉');
+        }
+        // Nothing more will happen until the next start; stop listening
+        closeStatusStream();
+    }
+    wasProcessing = status.is_processing;
+}
+
+// One-shot status fetch; the stream is only kept open while a run is active
+async function refreshStatus() {
+    try {
+        const status = await (await fetch('/api/status')).json();
+        updateUI(status);
+        if (status.is_processing) openStatusStream();
+    } catch (e) {
+        // Leave the page as rendered; the next start or tab switch retries
+    }
+}
+
+// Receive status updates over Server-Sent Events instead of polling
+function openStatusStream() {
+    if (statusStream || document.hidden) return;
+    statusStream = new EventSource('/api/status/stream');
+    statusStream.onmessage = e => updateUI(JSON.parse(e.data));
+}
+
+function closeStatusStream() {
+    if (!statusStream) return;
+    statusStream.close();
+    statusStream = null;
+}
+
+// Drop the stream while the tab is hidden; coming back refetches the
+// status, which reopens the stream if a run is still going
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden) {
+        closeStatusStream();
+    } else {
+        refreshStatus();
+    }
+});
+
+// Open review interface
+function openReview() {
+    window.location.href = '/review';
+}
+
+// Open library folder
+async function openLibrary() {
+    try {
+        const response = await fetch('/api/open-library', {method: 'POST'});
+        const result = await response.json();
+        if (result.success) {
+            showToast('Opening folder...');
+        } else {
+            showToast(result.message || 'Could not open folder');
+        }
+    } catch (e) {
+        showToast('Failed to open folder');
+    }
+}
+
+// One delegated click handler for every [data-action] element
+const actions = {
+    'process': startProcessing,
+    'review': openReview,
+    'library': openLibrary,
+    'save-settings': saveSettings
+};
+
+document.addEventListener('click', e => {
+    const target = e.target.closest('[data-action]');
+    if (!target) return;
+    const action = target.dataset.action;
+    if (action.startsWith('tab:')) {
+        showTab(action.slice(4), target);
+    } else if (actions[action]) {
+        actions[action]();
+    }
+});
+
+// Initialize
+loadSettings();
+
+// An idle tab makes no further requests after this
+refreshStatus();
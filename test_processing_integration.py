@@ -144,7 +144,7 @@ class ProcessingIntegrationTest:
             test_file = image_files[0]
             file_hash = processor._calculate_hash(test_file)
             
-            if file_hash and len(file_hash) == 64:  # SHA256 is 64 hex chars
+            if file_hash and len(file_hash) == 32:  # 128-bit BLAKE3/BLAKE2b digest is 32 hex chars
                 logger.info(f"✓ PASS: {test_name} - Calculated hash: {file_hash[:16]}...")
                 self.results.append(("PASS", test_name, f"Hash: {file_hash[:16]}..."))
                 return True
@@ -0,0 +1,70 @@
+"""
+Unit tests for burst grouping in PhotoProcessorEnhanced.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import PhotoProcessorEnhanced as ppe
+from PhotoProcessorEnhanced import PhotoFile, PhotoProcessorEnhanced
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def processor(request, temp_dir, monkeypatch):
+    """Processor with burst windowing done by NumPy or by the pure-Python fallback."""
+    if request.param and not ppe.NUMPY_AVAILABLE:
+        pytest.skip("NumPy not installed")
+    monkeypatch.setattr(ppe, "NUMPY_AVAILABLE", request.param)
+    return PhotoProcessorEnhanced(str(temp_dir), exiftool_path="exiftool")
+
+
+def _photo(name, offset):
+    start = datetime(2021, 6, 1, 12, 0, 0)
+    return PhotoFile(path=Path(name), size=1, date_taken=start + timedelta(seconds=offset))
+
+
+class TestGroupBursts:
+    """Tests for splitting photos into bursts by capture time."""
+
+    def test_groups_by_gap_between_neighbours(self, processor):
+        """Test a run stays together while each gap is within the threshold."""
+        gap = processor.BURST_TIME_THRESHOLD
+        processor.all_files = [
+            _photo("c.jpg", 2 * gap),
+            _photo("a.jpg", 0),
+            _photo("b.jpg", gap),
+            _photo("lone.jpg", 10 * gap),
+            _photo("d.jpg", 20 * gap),
+            _photo("e.jpg", 20 * gap + 0.5),
+            PhotoFile(path=Path("undated.jpg"), size=1),
+        ]
+
+        processor.group_bursts()
+
+        bursts = [[p.path.name for p in issue.files] for issue in processor.issues]
+        assert bursts == [["a.jpg", "b.jpg", "c.jpg"], ["d.jpg", "e.jpg"]]
+        assert processor.stats['bursts_found'] == 2
+
+    def test_recommends_best_photo(self, processor):
+        """Test the sharpest, larger photo with a sidecar is recommended and scored."""
+        soft = _photo("soft.jpg", 0)
+        soft.is_blurry = True
+        sharp = _photo("sharp.jpg", 1)
+        sharp.width, sharp.height, sharp.blur_score, sharp.has_json = 4000, 3000, 500.0, True
+        processor.all_files = [soft, sharp]
+
+        processor.group_bursts()
+
+        assert processor.issues[0].recommended_keep is sharp
+        assert sharp.quality_score == pytest.approx(1 / 1048576 + 12 + 5 + 10 + 5)
+        assert soft.quality_score == pytest.approx(1 / 1048576)
+
+    def test_no_dated_photos(self, processor):
+        """Test an empty or undated library yields no bursts."""
+        processor.all_files = [PhotoFile(path=Path("x.jpg"), size=1)]
+
+        processor.group_bursts()
+
+        assert processor.issues == []
@@ -0,0 +1,145 @@
+"""
+Unit tests for the persistent exiftool process in PhotoProcessorEnhanced.
+
+A small stand-in script speaks exiftool's -stay_open protocol, so these
+tests run without exiftool installed.
+"""
+
+import sys
+
+import pytest
+from PIL import Image
+
+from PhotoProcessorEnhanced import ExifToolDaemon, PhotoFile, PhotoProcessorEnhanced
+
+FAKE_EXIFTOOL = '''\
+import json, os, sys
+from PIL import Image
+
+with open(sys.argv[-1] + ".starts", "a") as f:
+    f.write("x")
+args = []
+for line in sys.stdin:
+    args.append(line.rstrip("\\n"))
+    if args[-2:] == ["-stay_open", "False"]:
+        break
+    if args[-1] != "-execute":
+        continue
+    entries = []
+    for path in args[:-1]:
+        if path.startswith("-"):
+            continue
+        try:
+            with Image.open(path) as img:
+                entries.append({"SourceFile": path, "ImageWidth": img.width, "ImageHeight": img.height})
+        except OSError:
+            entries.append({"SourceFile": path, "Error": "File format error"})
+    if "-j" in args:
+        print(json.dumps(entries))
+    elif any(arg.startswith("-DateTimeOriginal=") for arg in args):
+        # Like -overwrite_original: rewrite the file, keeping its mtime only with -P
+        for path in args[:-1]:
+            if not path.startswith("-"):
+                st = os.stat(path)
+                with open(path, "rb") as f:
+                    data = f.read()
+                with open(path, "wb") as f:
+                    f.write(data)
+                if "-P" in args:
+                    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    print("{ready}", flush=True)
+    args = []
+'''
+
+
+@pytest.fixture
+def fake_exiftool(temp_dir):
+    """Path to an executable that behaves like `exiftool -stay_open True -@ -`."""
+    if sys.platform == "win32":
+        pytest.skip("stand-in exiftool is a shebang script")
+    script = temp_dir / "exiftool"
+    script.write_text(f"#!{sys.executable}\n" + FAKE_EXIFTOOL.replace(
+        "sys.argv[-1]", repr(str(script))))
+    script.chmod(0o755)
+    return script
+
+
+class TestExifToolDaemon:
+    """Tests for batching exiftool commands through one process."""
+
+    def test_dimensions_batch(self, fake_exiftool, temp_dir):
+        """Test one command returns dimensions in input order, None when unreadable."""
+        big = temp_dir / "big.jpg"
+        Image.new("RGB", (640, 480)).save(big)
+        small = temp_dir / "small.png"
+        Image.new("RGB", (20, 10)).save(small)
+        broken = temp_dir / "broken.jpg"
+        broken.write_bytes(b"not an image")
+
+        with ExifToolDaemon(str(fake_exiftool)) as exiftool:
+            sizes = exiftool.get_dimensions_batch([small, broken, big])
+
+        assert sizes == [(20, 10), None, (640, 480)]
+
+    def test_one_process_for_many_commands(self, fake_exiftool, temp_dir):
+        """Test repeated commands reuse the running process."""
+        image = temp_dir / "a.jpg"
+        Image.new("RGB", (30, 30)).save(image)
+
+        with ExifToolDaemon(str(fake_exiftool)) as exiftool:
+            for _ in range(3):
+                assert exiftool.get_dimensions_batch([image]) == [(30, 30)]
+
+        assert (temp_dir / "exiftool.starts").read_text() == "x"
+
+    def test_quality_pass_flags_low_resolution(self, fake_exiftool, temp_dir):
+        """Test assess_quality_parallel uses the batched dimensions."""
+        import os
+
+        photos = []
+        for name, size in [("tiny.png", (200, 100)), ("large.png", (800, 600))]:
+            path = temp_dir / name
+            Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3)).save(path)
+            photos.append(path)
+        processor = PhotoProcessorEnhanced(str(temp_dir), exiftool_path=str(fake_exiftool))
+        processor.all_files = [PhotoFile(path=p) for p in photos]
+
+        processor.assess_quality_parallel()
+
+        low_res = [i.files[0].path for i in processor.issues if i.description.startswith("Low resolution")]
+        assert low_res == [photos[0]]
+        assert (processor.all_files[1].width, processor.all_files[1].height) == (800, 600)
+
+    def test_restored_files_keep_cached_hashes(self, fake_exiftool, temp_dir, monkeypatch):
+        """Test rewriting EXIF dates keeps mtimes, so a second run hashes nothing again."""
+        import json
+
+        import PhotoProcessorEnhanced as module
+
+        photos = []
+        for name in ("a.jpg", "b.jpg"):
+            path = temp_dir / name
+            Image.new("RGB", (64, 64), color="blue").save(path)
+            json_path = temp_dir / f"{name}.json"
+            json_path.write_text(json.dumps({"photoTakenTime": {"timestamp": "1500000000"}}))
+            photos.append((path, json_path))
+
+        def run():
+            processor = PhotoProcessorEnhanced(str(temp_dir), exiftool_path=str(fake_exiftool))
+            processor.all_files = [PhotoFile(path=p, has_json=True, json_path=j) for p, j in photos]
+            processor.restore_metadata()
+            processor.calculate_hashes_parallel()
+            return [photo.hash for photo in processor.all_files]
+
+        first = run()
+        real_open = open
+
+        def no_media_reads(file, *args, **kwargs):
+            if not str(file).endswith(".json"):
+                raise AssertionError(f"{file} was read again")
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(module, "open", no_media_reads, raising=False)
+
+        assert run() == first
+        assert first[0] and first[0] == first[1]
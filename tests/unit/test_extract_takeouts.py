@@ -0,0 +1,110 @@
+"""
+Unit tests for Google Takeout archive extraction in PhotoProcessorEnhanced.
+"""
+
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from PhotoProcessorEnhanced import PhotoProcessorEnhanced
+
+MEMBERS = {
+    "Takeout/Google Photos/2020/a.jpg": b"a" * 5000,
+    "Takeout/Google Photos/2020/a.jpg.json": b'{"title": "a.jpg"}',
+    "Takeout/Google Photos/2021/b.mp4": b"b" * 20000,
+    "Takeout/Google Photos/2021/c.png": b"c" * 300,
+}
+
+
+@pytest.fixture
+def processor(temp_dir):
+    """Processor with one takeout archive waiting to be extracted."""
+    proc = PhotoProcessorEnhanced(str(temp_dir), exiftool_path="exiftool", max_workers=3)
+    proc.takeout_dir.mkdir()
+    with zipfile.ZipFile(proc.takeout_dir / "takeout-001.zip", "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("Takeout/Google Photos/2020/", b"")
+        for name, data in MEMBERS.items():
+            zf.writestr(name, data)
+    return proc
+
+
+class TestExtractTakeouts:
+    """Tests for extracting takeout zips across worker threads."""
+
+    def test_extracts_every_member_and_archives_zip(self, processor):
+        """Test all members land in a folder named after the zip, which is then moved aside."""
+        assert processor.extract_takeouts() == 1
+
+        extract_dir = processor.takeout_dir / "takeout-001"
+        for name, data in MEMBERS.items():
+            assert (extract_dir / name).read_bytes() == data
+        assert not (processor.takeout_dir / "takeout-001.zip").exists()
+        assert (processor.takeout_dir / "archives" / "takeout-001.zip").exists()
+
+    def test_skips_members_already_extracted(self, processor, monkeypatch):
+        """Test a resumed extraction only writes members missing or cut short on disk."""
+        extract_dir = processor.takeout_dir / "takeout-001"
+        done = extract_dir / "Takeout/Google Photos/2021/b.mp4"
+        done.parent.mkdir(parents=True)
+        done.write_bytes(MEMBERS["Takeout/Google Photos/2021/b.mp4"])
+        partial = extract_dir / "Takeout/Google Photos/2021/c.png"
+        partial.write_bytes(b"c" * 10)
+
+        written = []
+        real_extract = zipfile.ZipFile.extract
+
+        def recording_extract(self, member, path=None, pwd=None):
+            written.append(member.filename)
+            return real_extract(self, member, path, pwd)
+
+        monkeypatch.setattr(zipfile.ZipFile, "extract", recording_extract)
+        processor.extract_takeouts()
+
+        assert "Takeout/Google Photos/2021/b.mp4" not in written
+        assert "Takeout/Google Photos/2021/c.png" in written
+        assert partial.read_bytes() == MEMBERS["Takeout/Google Photos/2021/c.png"]
+
+    def test_many_workers_share_album_folders(self, temp_dir):
+        """Test workers extracting same-size files into the same new folders never collide."""
+        proc = PhotoProcessorEnhanced(str(temp_dir), exiftool_path="exiftool", max_workers=8)
+        proc.takeout_dir.mkdir()
+        names = [f"Takeout/Google Photos/album{i:03d}/IMG_{j}.jpg" for i in range(300) for j in range(2)]
+        with zipfile.ZipFile(proc.takeout_dir / "big.zip", "w") as zf:
+            zf.writestr("Takeout/Google Photos/album000/", b"")
+            for name in names:
+                zf.writestr(name, b"x" * 100)
+
+        assert proc.extract_takeouts() == 1
+
+        extract_dir = proc.takeout_dir / "big"
+        assert all((extract_dir / name).read_bytes() == b"x" * 100 for name in names)
+        assert (proc.takeout_dir / "archives" / "big.zip").exists()
+
+    def test_member_target_matches_extract(self, temp_dir):
+        """Test the precomputed path of an album with a ':' is where extract() writes it."""
+        member = zipfile.ZipInfo("Takeout/Google Photos/Trip: Paris/a.jpg")
+        with zipfile.ZipFile(temp_dir / "a.zip", "w") as zf:
+            zf.writestr(member, b"a")
+        with zipfile.ZipFile(temp_dir / "a.zip") as zf:
+            written = zf.extract(member, temp_dir / "out")
+
+        assert PhotoProcessorEnhanced._member_target(member, temp_dir / "out") == Path(written)
+
+    def test_member_target_sanitized_on_windows(self, temp_dir, monkeypatch):
+        """Test names are cleaned as on Windows, where ':' and trailing dots are not allowed."""
+        monkeypatch.setattr(os, "sep", "\\")
+        monkeypatch.setattr(os, "altsep", "/")
+        member = zipfile.ZipInfo("Takeout/Google Photos/Trip: Paris.../a?.jpg")
+
+        target = PhotoProcessorEnhanced._member_target(member, temp_dir)
+
+        assert target == temp_dir / "Takeout" / "Google Photos" / "Trip_ Paris" / "a_.jpg"
+
+    def test_cancelled_extraction_keeps_zip(self, processor):
+        """Test a cancelled run leaves the zip in place to be resumed."""
+        processor.cancel()
+
+        assert processor.extract_takeouts() == 0
+        assert (processor.takeout_dir / "takeout-001.zip").exists()
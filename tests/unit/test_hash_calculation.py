@@ -3,19 +3,29 @@ Unit tests for hash calculation in PhotoProcessorEnhanced.
 """
 
 import hashlib
+import os
 from pathlib import Path
 
 import pytest
 
+from PhotoProcessorEnhanced import BLAKE3_AVAILABLE, _new_content_hash
+
+
+def content_hash(data: bytes) -> str:
+    """The processor's content hash of data: BLAKE3 if installed, else BLAKE2b-128."""
+    hash_obj = _new_content_hash()
+    hash_obj.update(data)
+    return hash_obj.hexdigest()[:32]
+
 
 def calculate_file_hash(file_path: Path) -> str:
     """
     Helper function to calculate file hash.
     This mirrors the implementation in PhotoProcessorEnhanced.
     """
-    hash_obj = hashlib.sha256()
+    hash_obj = hashlib.blake2b(digest_size=16)
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
+        while chunk := f.read(1024 * 1024):
             hash_obj.update(chunk)
     return hash_obj.hexdigest()
 
@@ -29,7 +39,7 @@ class TestHashCalculation:
 
         assert hash_value is not None
         assert isinstance(hash_value, str)
-        assert len(hash_value) == 64  # SHA256 produces 64 hex characters
+        assert len(hash_value) == 32  # BLAKE2b-128 produces 32 hex characters
 
     def test_hash_consistency(self, sample_image):
         """Test that hashing the same file twice produces the same result."""
@@ -67,7 +77,7 @@ class TestHashCalculation:
 
         hash_value = calculate_file_hash(large_file)
         assert hash_value is not None
-        assert len(hash_value) == 64
+        assert len(hash_value) == 32
 
     def test_hash_empty_file(self, temp_dir):
         """Test hashing an empty file."""
@@ -76,8 +86,8 @@ class TestHashCalculation:
 
         hash_value = calculate_file_hash(empty_file)
         assert hash_value is not None
-        # Empty file should have a known SHA256 hash
-        expected_empty_hash = hashlib.sha256(b'').hexdigest()
+        # Empty file should have a known BLAKE2b hash
+        expected_empty_hash = hashlib.blake2b(b'', digest_size=16).hexdigest()
         assert hash_value == expected_empty_hash
 
     def test_hash_nonexistent_file(self, temp_dir):
@@ -97,7 +107,7 @@ class TestHashCalculation:
         assert hash_value is not None
 
         # Verify by calculating expected hash
-        expected = hashlib.sha256(binary_content).hexdigest()
+        expected = hashlib.blake2b(binary_content, digest_size=16).hexdigest()
         assert hash_value == expected
 
     def test_hash_performance(self, temp_dir, benchmark):
@@ -199,6 +209,241 @@ class TestDuplicateDetection:
             assert len(files) == 2
 
 
+class TestProcessorDuplicates:
+    """Tests for the processor's size-bucketed duplicate detection."""
+
+    @pytest.fixture
+    def processor(self, temp_dir):
+        from PhotoProcessorEnhanced import PhotoProcessorEnhanced, PhotoFile
+
+        def make(paths):
+            proc = PhotoProcessorEnhanced(str(temp_dir), exiftool_path="exiftool")
+            proc.all_files = [PhotoFile(path=p) for p in paths]
+            return proc
+        return make
+
+    def test_unique_sizes_not_hashed(self, processor, sample_images, duplicate_images):
+        """Test only files sharing a size are read and hashed."""
+        proc = processor(list(sample_images) + list(duplicate_images))
+
+        proc.calculate_hashes_parallel()
+
+        hashed = {p.path for p in proc.all_files if p.hash}
+        assert hashed == set(duplicate_images)
+        assert all(p.hash is None for p in proc.all_files if p.path in sample_images)
+
+    def test_same_size_different_content_not_duplicates(self, processor, temp_dir, duplicate_images):
+        """Test a same-size file with other content is hashed but not grouped."""
+        other = temp_dir / "same_size.jpg"
+        other.write_bytes(b"\0" * duplicate_images[0].stat().st_size)
+        proc = processor(list(duplicate_images) + [other])
+
+        proc.calculate_hashes_parallel()
+        proc.find_duplicates()
+
+        groups = [issue.files for issue in proc.issues if issue.category == 'duplicates']
+        assert [sorted(p.path for p in files) for files in groups] == [sorted(duplicate_images)]
+        assert proc.stats['duplicates_found'] == 1
+
+    def test_unchanged_files_reuse_cached_hash(self, processor, duplicate_images, monkeypatch):
+        """Test a second run takes hashes from the cache instead of rereading files."""
+        import PhotoProcessorEnhanced as module
+
+        first = processor(duplicate_images)
+        first.calculate_hashes_parallel()
+        assert first.hash_cache_file.exists()
+
+        second = processor(duplicate_images)
+
+        def no_reads(*args, **kwargs):
+            raise AssertionError("file was read again")
+
+        monkeypatch.setattr(module, "open", no_reads, raising=False)
+        second.calculate_hashes_parallel()
+
+        assert [p.hash for p in second.all_files] == [p.hash for p in first.all_files]
+
+    def test_modified_file_rehashed(self, processor, duplicate_images):
+        """Test a file whose size or mtime changed is hashed again."""
+        import os
+
+        first = processor(duplicate_images)
+        first.calculate_hashes_parallel()
+        img1, img2 = duplicate_images
+        img2.write_bytes(b"\1" * img1.stat().st_size)
+        os.utime(img2, ns=(0, 1_000_000_000))
+
+        second = processor(duplicate_images)
+        second.calculate_hashes_parallel()
+
+        assert second.all_files[0].hash == first.all_files[0].hash
+        assert second.all_files[1].hash != first.all_files[1].hash
+
+    def test_large_files_hashed_in_parts(self, processor, temp_dir):
+        """Test files over the threshold get a tree hash that still tells them apart."""
+        paths = []
+        for name, tail in [("a.mp4", b"x"), ("b.mp4", b"x"), ("c.mp4", b"y")]:
+            path = temp_dir / name
+            path.write_bytes(bytes(range(256)) * 40 + tail)
+            paths.append(path)
+        proc = processor(paths)
+        proc.LARGE_FILE_HASH_THRESHOLD = 4096
+        proc.HASH_PART_SIZE = 1024
+
+        proc.calculate_hashes_parallel()
+
+        data = paths[0].read_bytes()
+        if BLAKE3_AVAILABLE:
+            expected = content_hash(data)  # BLAKE3 streams the parts into one hash
+        else:
+            parts = b"".join(hashlib.blake2b(data[i:i + 1024], digest_size=16).digest()
+                             for i in range(0, len(data), 1024))
+            expected = hashlib.blake2b(parts, digest_size=16).hexdigest()
+        hashes = [p.hash for p in proc.all_files]
+        assert hashes[0] == hashes[1] == expected
+        assert hashes[2] != hashes[0]
+
+    def test_partial_hash_rules_out_different_ends(self, processor, temp_dir):
+        """Test same-size files that differ at either end are never read in full."""
+        paths = []
+        for name, head, tail in [("a.mov", b"a", b"z"), ("b.mov", b"a", b"z"),
+                                 ("c.mov", b"b", b"z"), ("d.mov", b"a", b"y")]:
+            path = temp_dir / name
+            path.write_bytes(head * 64 + b"\0" * 512 + tail * 64)
+            paths.append(path)
+        proc = processor(paths)
+        proc.PARTIAL_HASH_SIZE = 64
+
+        proc.calculate_hashes_parallel()
+
+        hashes = {p.path.name: p.hash for p in proc.all_files}
+        assert hashes["a.mov"] == hashes["b.mov"] == content_hash(paths[0].read_bytes())
+        assert hashes["c.mov"] is None and hashes["d.mov"] is None
+
+    def test_cached_files_skip_partial_hash(self, processor, temp_dir, monkeypatch):
+        """Test a fully cached second run goes straight to the cache without reading file ends."""
+        from PhotoProcessorEnhanced import PhotoProcessorEnhanced
+
+        paths = []
+        for name in ("a.mov", "b.mov", "c.mov"):
+            path = temp_dir / name
+            path.write_bytes(b"x" * 640)
+            paths.append(path)
+        first = processor(paths)
+        first.PARTIAL_HASH_SIZE = 64
+        first.calculate_hashes_parallel()
+
+        def no_partial_hash(self, file_path):
+            raise AssertionError(f"partial hash of {file_path}")
+
+        monkeypatch.setattr(PhotoProcessorEnhanced, "_calculate_partial_hash", no_partial_hash)
+        second = processor(paths)
+        second.PARTIAL_HASH_SIZE = 64
+        second.calculate_hashes_parallel()
+
+        assert [p.hash for p in second.all_files] == [p.hash for p in first.all_files]
+
+    def test_uncached_file_still_compared_with_cached_ones(self, processor, temp_dir):
+        """Test a new file the same size as a cached one is hashed in full, not ruled out on its ends."""
+        original = temp_dir / "a.mov"
+        original.write_bytes(b"a" * 64 + b"\0" * 512 + b"z" * 64)
+        other = temp_dir / "b.mov"
+        other.write_bytes(original.read_bytes())
+        first = processor([original, other])
+        first.PARTIAL_HASH_SIZE = 64
+        first.calculate_hashes_parallel()
+
+        copy = temp_dir / "copy.mov"
+        copy.write_bytes(original.read_bytes())
+        second = processor([original, copy])
+        second.PARTIAL_HASH_SIZE = 64
+        second.calculate_hashes_parallel()
+
+        assert second.all_files[0].hash == second.all_files[1].hash == first.all_files[0].hash
+
+    def test_cancel_stops_hash_mid_file(self, processor, temp_dir):
+        """Test a cancelled hash gives up inside the read loop and is not cached."""
+        path = temp_dir / "clip.mp4"
+        path.write_bytes(b"x" * 4096)
+        proc = processor([path])
+        proc.HASH_CHUNK_SIZE = 64
+        proc.HASH_CANCEL_CHECK_BLOCKS = 4
+        checks = []
+        real_is_cancelled = proc.is_cancelled
+
+        def is_cancelled():
+            checks.append(1)
+            if len(checks) == 3:
+                proc.cancel()
+            return real_is_cancelled()
+
+        proc.is_cancelled = is_cancelled
+
+        assert proc._calculate_hash(path) == ""
+        assert len(checks) == 3
+        assert proc._hash_cache_updates == []
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+    def test_only_videos_dropped_from_page_cache(self, processor, temp_dir, monkeypatch):
+        """Test hashed videos are evicted from the page cache but images, read again later, are not."""
+        image = temp_dir / "a.jpg"
+        video = temp_dir / "a.mp4"
+        image.write_bytes(b"i" * 100)
+        video.write_bytes(b"v" * 100)
+        advice = []
+        monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, hint: advice.append(hint))
+        proc = processor([])
+
+        proc._calculate_hash(image)
+        assert advice == [os.POSIX_FADV_SEQUENTIAL]
+        proc._calculate_hash(video)
+        assert advice[1:] == [os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_DONTNEED]
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+    def test_prefetches_only_uncached_files(self, processor, duplicate_images, monkeypatch):
+        """Test readahead is requested for files about to be read, not for cache hits."""
+        first = processor(duplicate_images)
+        first.calculate_hashes_parallel()
+        advice = []
+        monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, hint: advice.append(hint))
+
+        processor(duplicate_images).calculate_hashes_parallel()
+        assert os.POSIX_FADV_WILLNEED not in advice
+
+        first.hash_cache_file.unlink()
+        processor(duplicate_images).calculate_hashes_parallel()
+        assert advice.count(os.POSIX_FADV_WILLNEED) == len(duplicate_images)
+
+    def test_bounded_submission_stops_on_cancel(self, processor):
+        """Test only a small window of work is queued and cancelling stops new submissions."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        proc = processor([])
+        queued = []
+        outstanding = [0]
+
+        def work(item):
+            return item
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            submit = executor.submit
+
+            def counting_submit(fn, item):
+                outstanding[0] += 1
+                queued.append(outstanding[0])
+                return submit(fn, item)
+
+            executor.submit = counting_submit
+            for n, (item, future) in enumerate(proc._submit_bounded(executor, 2, work, range(1000))):
+                outstanding[0] -= 1
+                assert future.result() == item
+                if n == 20:
+                    proc.cancel()
+
+        assert max(queued) <= proc.IN_FLIGHT_PER_WORKER * 2
+        assert len(queued) < 40
+
+
 @pytest.mark.slow
 class TestHashPerformance:
     """Performance tests for hash calculation."""
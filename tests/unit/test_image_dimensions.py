@@ -0,0 +1,65 @@
+"""
+Unit tests for reading image dimensions from file headers.
+"""
+
+import struct
+
+import pytest
+from PIL import Image
+
+from PhotoProcessorEnhanced import _fast_dimensions
+
+
+class TestFastDimensions:
+    """Tests for _fast_dimensions header parsing."""
+
+    @pytest.mark.parametrize("name, fmt, kwargs", [
+        ("photo.jpg", "JPEG", {}),
+        ("progressive.jpeg", "JPEG", {"progressive": True}),
+        ("photo.png", "PNG", {}),
+        ("photo.gif", "GIF", {}),
+        ("lossy.webp", "WEBP", {}),
+        ("lossless.webp", "WEBP", {"lossless": True}),
+        ("photo.bmp", "BMP", {}),
+    ])
+    def test_matches_pillow(self, temp_dir, name, fmt, kwargs):
+        """Test header parsing agrees with a full decode for each format."""
+        path = temp_dir / name
+        Image.new("RGB", (321, 123), color="red").save(path, fmt, **kwargs)
+
+        assert _fast_dimensions(path) == (321, 123)
+
+    def test_jpeg_with_large_exif_segment(self, temp_dir):
+        """Test the SOF marker is found past an APP1 block bigger than one read."""
+        path = temp_dir / "exif.jpg"
+        img = Image.new("RGB", (640, 480))
+        exif = img.getexif()
+        exif[0x010E] = "x" * 60000  # ImageDescription
+        img.save(path, "JPEG", exif=exif)
+
+        assert _fast_dimensions(path) == (640, 480)
+
+    def test_heif_takes_largest_ispe(self, temp_dir):
+        """Test a HEIC grid reports its full size rather than a tile size."""
+        def box(kind, payload):
+            return struct.pack(">I", 8 + len(payload)) + kind + payload
+
+        def ispe(width, height):
+            return box(b"ispe", b"\0\0\0\0" + struct.pack(">II", width, height))
+
+        path = temp_dir / "photo.heic"
+        path.write_bytes(box(b"ftyp", b"heic\0\0\0\0mif1heic")
+                         + box(b"meta", box(b"ipco", ispe(512, 512) + ispe(4032, 3024))))
+
+        assert _fast_dimensions(path) == (4032, 3024)
+
+    def test_unknown_or_broken_files(self, temp_dir):
+        """Test unrecognised and truncated files return None for the exiftool fallback."""
+        text = temp_dir / "notes.jpg"
+        text.write_text("not an image")
+        truncated = temp_dir / "cut.png"
+        truncated.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        assert _fast_dimensions(text) is None
+        assert _fast_dimensions(truncated) is None
+        assert _fast_dimensions(temp_dir / "missing.jpg") is None
@@ -0,0 +1,145 @@
+"""
+Unit tests for sorting files into the library and review folders.
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from PhotoProcessorEnhanced import PhotoFile, PhotoProcessorEnhanced, ProcessingIssue, _fast_copy, _reflink
+
+
+@pytest.fixture
+def processor(temp_dir):
+    """Processor with its folders created and a few takeout files on disk."""
+    proc = PhotoProcessorEnhanced(str(temp_dir), exiftool_path="exiftool")
+    proc.setup_folder_structure()
+    return proc
+
+
+def _photo(proc, name, **fields):
+    path = proc.takeout_dir / name
+    path.write_bytes(name.encode())
+    return PhotoFile(path=path, **fields)
+
+
+class TestOrganizeFiles:
+    """Tests for organize_files routing."""
+
+    def test_routes_flagged_files_and_moves_the_rest(self, processor):
+        """Test flagged files go to their review folder, keepers and clean files to the library."""
+        keep = _photo(processor, "keep.jpg", date_taken=datetime(2020, 5, 1))
+        dupe = _photo(processor, "dupe.jpg")
+        blurry = _photo(processor, "blurry.jpg")
+        clean = _photo(processor, "clean.jpg")
+        processor.all_files = [keep, dupe, blurry, clean]
+        processor.issues = [
+            ProcessingIssue(category='duplicates', files=[keep, dupe], recommended_keep=keep),
+            ProcessingIssue(category='blur_corrupt', files=[blurry]),
+        ]
+
+        processor.organize_files()
+
+        assert (processor.review_dirs['duplicates'] / "dupe.jpg").exists()
+        assert (processor.review_dirs['blur_corrupt'] / "blurry.jpg").exists()
+        assert (processor.photos_videos_dir / "2020-05" / "keep.jpg").exists()
+        assert (processor.photos_videos_dir / "Unknown Date" / "clean.jpg").exists()
+        assert processor.stats['moved_to_library'] == 2
+
+    def test_keeper_flagged_elsewhere_goes_to_that_folder(self, processor):
+        """Test a duplicate keeper that is also blurry is reviewed as blurry."""
+        keep = _photo(processor, "keep.jpg")
+        dupe = _photo(processor, "dupe.jpg")
+        processor.all_files = [keep, dupe]
+        processor.issues = [
+            ProcessingIssue(category='duplicates', files=[keep, dupe], recommended_keep=keep),
+            ProcessingIssue(category='blur_corrupt', files=[keep]),
+        ]
+
+        processor.organize_files()
+
+        assert (processor.review_dirs['blur_corrupt'] / "keep.jpg").exists()
+        assert not (processor.review_dirs['duplicates'] / "keep.jpg").exists()
+
+    def test_review_copies_share_the_original_when_possible(self, processor, monkeypatch):
+        """Test review files are hard links to the kept original, or real copies if linking fails."""
+        linked = _photo(processor, "linked.jpg")
+        copied = _photo(processor, "copied.jpg")
+        processor.all_files = [linked, copied]
+        processor.issues = [ProcessingIssue(category='too_small', files=[linked, copied])]
+        real_link = os.link
+
+        def link(src, dst):
+            if "copied" in str(src):
+                raise OSError("cross-device link")
+            real_link(src, dst)
+
+        monkeypatch.setattr(os, "link", link)
+        processor.organize_files()
+
+        review = processor.review_dirs['too_small']
+        assert os.path.samefile(review / "linked.jpg", linked.path)
+        assert not os.path.samefile(review / "copied.jpg", copied.path)
+        assert (review / "copied.jpg").read_bytes() == copied.path.read_bytes()
+        assert (review / "copied.jpg").stat().st_mtime == copied.path.stat().st_mtime
+
+    def test_same_names_get_distinct_destinations(self, processor):
+        """Test files sharing a name never overwrite each other, however the threads interleave."""
+        photos = []
+        for i in range(6):
+            folder = processor.takeout_dir / f"album{i}"
+            folder.mkdir()
+            path = folder / "IMG_0001.jpg"
+            path.write_bytes(bytes([i]) * 10)
+            photos.append(PhotoFile(path=path, date_taken=datetime(2019, 1, 1)))
+        processor.all_files = photos
+
+        processor.organize_files()
+
+        month = processor.photos_videos_dir / "2019-01"
+        assert sorted(p.read_bytes()[0] for p in month.iterdir()) == list(range(6))
+        assert processor.stats['moved_to_library'] == 6
+        assert processor.progress.files_processed == 6
+
+    def test_existing_names_are_not_overwritten(self, processor):
+        """Test names already in the folder, in any case, push new files to a numbered name."""
+        month = processor.photos_videos_dir / "2019-01"
+        month.mkdir(parents=True)
+        (month / "img_0001.JPG").write_bytes(b"old")
+        (month / "IMG_0001_1.jpg").write_bytes(b"old")
+        photo = _photo(processor, "IMG_0001.jpg", date_taken=datetime(2019, 1, 1))
+        processor.all_files = [photo]
+
+        processor.organize_files()
+
+        assert (month / "IMG_0001_2.jpg").read_bytes() == b"IMG_0001.jpg"
+        assert (month / "img_0001.JPG").read_bytes() == b"old"
+
+
+class TestFastCopy:
+    """Tests for the copy used when a review file cannot be hard-linked."""
+
+    def test_reflink_clones_or_leaves_nothing(self, temp_dir):
+        """Test a clone matches the source, and a refused clone leaves no partial file."""
+        src = temp_dir / "clip.mp4"
+        src.write_bytes(os.urandom(64 * 1024))
+        dst = temp_dir / "clone.mp4"
+
+        if _reflink(src, dst):
+            assert dst.read_bytes() == src.read_bytes()
+            assert dst.stat().st_mtime == src.stat().st_mtime
+        else:
+            assert not dst.exists()
+
+    def test_copy_keeps_contents_and_mtime(self, temp_dir):
+        """Test the copy is complete and keeps the modification time, whichever path is taken."""
+        src = temp_dir / "clip.mp4"
+        src.write_bytes(os.urandom(64 * 1024))
+        os.utime(src, (1_500_000_000, 1_500_000_000))
+        dst = temp_dir / "copy.mp4"
+
+        _fast_copy(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == 1_500_000_000
@@ -0,0 +1,32 @@
+"""
+Unit tests for PhotoProcessorEnhanced log file handling.
+"""
+
+import logging
+
+import PhotoProcessorEnhanced as ppe
+from PhotoProcessorEnhanced import PhotoProcessorEnhanced
+
+
+class TestProcessorLogging:
+    """Tests for the per-run processing log."""
+
+    def test_new_processor_replaces_log_handler(self, temp_dir):
+        """Test each instance swaps in its own file handler and closes the previous one."""
+        logger = logging.getLogger(ppe.__name__)
+        (temp_dir / "one").mkdir()
+        (temp_dir / "two").mkdir()
+        first = PhotoProcessorEnhanced(str(temp_dir / "one"), exiftool_path="exiftool")
+        first_handler = PhotoProcessorEnhanced._log_file_handler
+        second = PhotoProcessorEnhanced(str(temp_dir / "two"), exiftool_path="exiftool")
+        second_handler = PhotoProcessorEnhanced._log_file_handler
+
+        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+        assert file_handlers == [second_handler]
+        assert first_handler.stream is None  # closed
+        assert first.logger is second.logger
+
+        second.logger.info("second run")
+        second_handler.flush()
+        log_text = "".join(p.read_text() for p in (temp_dir / "two" / "logs").glob("processing_*.log"))
+        assert "second run" in log_text
@@ -274,6 +274,93 @@ class TestQualityAssessmentCombined:
             assert result['file_size'] >= 0
 
 
+@pytest.mark.requires_opencv
+class TestProcessorBlurScore:
+    """Tests for PhotoProcessorEnhanced.detect_blur_opencv."""
+
+    @pytest.fixture
+    def processor(self, temp_dir):
+        from PhotoProcessorEnhanced import PhotoProcessorEnhanced
+        return PhotoProcessorEnhanced(str(temp_dir), exiftool_path="exiftool")
+
+    def test_score_matches_reference(self, processor, sample_image, blurry_image):
+        """Test the grayscale decode and int16 Laplacian track the BGR float64 reference."""
+        for image in (sample_image, blurry_image):
+            expected_blurry, expected_score = calculate_blur_score(image)
+
+            is_blurry, score = processor.detect_blur_opencv(image)
+
+            assert score == pytest.approx(expected_score, rel=1e-3, abs=1e-3)
+            assert is_blurry == expected_blurry
+
+    def test_quality_pass_sorts_issues(self, processor, sample_image, blurry_image, temp_dir):
+        """Test size checks run inline and only the remaining images are blur-scored."""
+        from PhotoProcessorEnhanced import PhotoFile
+
+        thumb = temp_dir / "thumb.png"
+        Image.new('RGB', (100, 100), color='red').save(thumb)
+        processor.MIN_FILE_SIZE_KB = 0
+        processor.exiftool_path = None
+        processor.all_files = [PhotoFile(path=p) for p in (sample_image, blurry_image, thumb)]
+
+        processor.assess_quality_parallel()
+
+        by_path = {issue.files[0].path: issue for issue in processor.issues}
+        assert set(by_path) == {blurry_image, thumb}
+        assert by_path[blurry_image].category == 'blur_corrupt'
+        assert by_path[thumb].description == "Low resolution: 100x100"
+        assert processor.all_files[0].blur_score > processor.BLUR_THRESHOLD
+        assert processor.all_files[2].blur_score is None
+        assert processor.stats['blurry_found'] == 1
+        assert processor.stats['too_small_found'] == 1
+        assert processor.progress.files_processed == 3
+
+    def test_unparsed_header_sized_by_blur_decode(self, processor, sample_image, temp_dir, monkeypatch):
+        """Test an image with an unrecognised header gets its size from the decode, not exiftool."""
+        import PhotoProcessorEnhanced as module
+        from PhotoProcessorEnhanced import PhotoFile
+
+        thumb = temp_dir / "thumb.png"
+        Image.new('RGB', (100, 100), color='red').save(thumb)
+        processor.MIN_FILE_SIZE_KB = 0
+        processor.all_files = [PhotoFile(path=p) for p in (sample_image, thumb)]
+        monkeypatch.setattr(module, "_fast_dimensions", lambda path: None)
+
+        def no_exiftool(*args, **kwargs):
+            raise AssertionError("exiftool was started")
+
+        monkeypatch.setattr(module, "ExifToolDaemon", no_exiftool)
+        processor.assess_quality_parallel()
+
+        assert [(p.width, p.height) for p in processor.all_files] == [(800, 600), (100, 100)]
+        assert [issue.description for issue in processor.issues] == ["Low resolution: 100x100"]
+        assert processor.stats['too_small_found'] == 1
+        assert processor.progress.files_processed == 2
+
+    def test_numpy_fallback_without_opencv(self, processor, sample_image, blurry_image, monkeypatch):
+        """Test the NumPy path scores close to OpenCV when cv2 is missing."""
+        import PhotoProcessorEnhanced as module
+
+        expected = [calculate_blur_score(image) for image in (sample_image, blurry_image)]
+        monkeypatch.setattr(module, "OPENCV_AVAILABLE", False)
+
+        for image, (expected_blurry, expected_score) in zip((sample_image, blurry_image), expected):
+            is_blurry, score = processor.detect_blur_opencv(image)
+
+            assert score == pytest.approx(expected_score, rel=0.05, abs=0.5)
+            assert is_blurry == expected_blurry
+
+    def test_numpy_fallback_unreadable_file(self, processor, temp_dir, monkeypatch):
+        """Test the NumPy path reports an undecodable image as corrupt."""
+        import PhotoProcessorEnhanced as module
+
+        broken = temp_dir / "broken.jpg"
+        broken.write_bytes(b"not an image")
+        monkeypatch.setattr(module, "OPENCV_AVAILABLE", False)
+
+        assert processor.detect_blur_opencv(broken) == (True, 0.0)
+
+
 @pytest.mark.slow
 @pytest.mark.requires_opencv
 class TestQualityPerformance:
@@ -0,0 +1,60 @@
+"""
+Unit tests for media discovery in PhotoProcessorEnhanced.scan_files.
+"""
+
+import os
+
+import pytest
+
+from PhotoProcessorEnhanced import PhotoProcessorEnhanced
+
+
+@pytest.fixture
+def processor(temp_dir):
+    """Processor rooted at the temporary directory."""
+    return PhotoProcessorEnhanced(str(temp_dir), exiftool_path="exiftool")
+
+
+class TestScanFiles:
+    """Tests for scanning the library and takeout folders."""
+
+    def test_finds_media_with_sidecars(self, processor, mock_google_takeout):
+        """Test every photo is found with its size, and the JSON sidecar is linked."""
+        processor.scan_files()
+
+        found = {photo.path: photo for photo in processor.all_files}
+        assert set(found) == {mock_google_takeout / f"photo_{i}.jpg" for i in range(5)}
+        first = found[mock_google_takeout / "photo_0.jpg"]
+        assert first.has_json
+        assert first.json_path == mock_google_takeout / "photo_0.jpg.json"
+        assert first.size == first.path.stat().st_size
+        assert not found[mock_google_takeout / "photo_1.jpg"].has_json
+        assert processor.stats['total_processed'] == 5
+
+    def test_walks_nested_folders_and_skips_other_files(self, processor, temp_dir):
+        """Test nested folders are scanned and non-media files are ignored."""
+        library = temp_dir / "Photos & Videos"
+        (library / "2020-01" / "deeper").mkdir(parents=True)
+        (library / "2020-01" / "a.JPG").write_bytes(b"a")
+        (library / "2020-01" / "deeper" / "clip.mp4").write_bytes(b"bb")
+        (library / "2020-01" / "notes.txt").write_text("x")
+        (library / ".jpg").write_bytes(b"no suffix, like Path.suffix")
+
+        processor.scan_files()
+
+        assert sorted(p.path.name for p in processor.all_files) == ["a.JPG", "clip.mp4"]
+        assert {p.path.name: p.size for p in processor.all_files} == {"a.JPG": 1, "clip.mp4": 2}
+
+    @pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt", reason="needs POSIX symlinks")
+    def test_does_not_follow_directory_symlinks(self, processor, temp_dir):
+        """Test a symlinked folder is not descended into, matching os.walk."""
+        outside = temp_dir / "outside"
+        outside.mkdir()
+        (outside / "x.jpg").write_bytes(b"x")
+        library = temp_dir / "Photos & Videos"
+        library.mkdir()
+        os.symlink(outside, library / "link")
+
+        processor.scan_files()
+
+        assert processor.all_files == []
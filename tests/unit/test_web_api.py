@@ -0,0 +1,674 @@
+"""
+Unit tests for the PhotoManagerWeb Flask API.
+"""
+
+import sys
+
+import pytest
+
+# Import the module to test
+try:
+    import PhotoManagerWeb as web
+except ImportError:
+    pytest.skip("PhotoManagerWeb not available", allow_module_level=True)
+
+
+@pytest.fixture
+def client(temp_dir, monkeypatch):
+    """Flask test client with settings stored in a temporary directory."""
+    monkeypatch.setattr(web, "CONFIG_FILE", temp_dir / "config.json")
+    web.app.config["TESTING"] = True
+    return web.app.test_client()
+
+
+class TestIndexPage:
+    """Tests for the home page."""
+
+    def test_index_served_as_html(self, client):
+        """Test the home page is returned as UTF-8 HTML."""
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/html"
+        assert response.mimetype_params["charset"] == "utf-8"
+
+    def test_index_local_ip_substituted(self, client):
+        """Test the local IP placeholder is filled in."""
+        response = client.get("/")
+
+        assert b"{{ local_ip }}" not in response.data
+        assert f"http://{web.get_local_ip()}:5000".encode() in response.data
+
+    def test_index_not_modified(self, client):
+        """Test a matching If-None-Match returns 304 with no body."""
+        etag = client.get("/").headers["ETag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+    def test_index_gzip_encoding(self, client):
+        """Test gzip-capable clients receive the precompressed page."""
+        import gzip
+
+        plain = client.get("/").data
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert gzip.decompress(response.data) == plain
+
+    def test_review_page_not_modified(self, client):
+        """Test the review page is cached with an ETag and revalidates to 304."""
+        response = client.get("/review")
+        assert response.status_code == 200
+        assert response.mimetype == "text/html"
+
+        response = client.get("/review", headers={"If-None-Match": response.headers["ETag"]})
+
+        assert response.status_code == 304
+
+
+class TestStaticAssets:
+    """Tests for the minified front-end assets."""
+
+    def test_index_links_hashed_assets(self, client):
+        """Test the home page references the content-hashed CSS and JS."""
+        response = client.get("/")
+
+        for name in web.ASSET_NAMES.values():
+            assert f"/assets/{name}".encode() in response.data
+
+    def test_asset_cached_immutably(self, client):
+        """Test assets are served with a long-lived immutable cache policy."""
+        response = client.get(f"/assets/{web.ASSET_NAMES['app.css']}")
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/css"
+        assert "immutable" in response.headers["Cache-Control"]
+
+    def test_unknown_asset_not_found(self, client):
+        """Test requesting an unknown asset name returns 404."""
+        response = client.get("/assets/app.0000000000000000.css")
+
+        assert response.status_code == 404
+
+    def test_minify_css(self):
+        """Test comments and whitespace are stripped from stylesheets."""
+        css = "/* note */\n.a {\n    color: red;\n    margin: 0 auto;\n}\n"
+
+        assert web.minify_css(css) == ".a{color:red;margin:0 auto}"
+
+
+class TestStatusStream:
+    """Tests for the Server-Sent Events status stream."""
+
+    def test_stream_sends_current_status(self, client):
+        """Test the first event carries the current processing status."""
+        import json
+
+        response = client.get("/api/status/stream", buffered=False)
+        try:
+            assert response.mimetype == "text/event-stream"
+            event = next(response.response).decode()
+        finally:
+            response.close()
+
+        assert event.startswith("data: ")
+        assert event.endswith("\n\n")
+        status = json.loads(event[len("data: "):])
+        assert status["is_processing"] == web.processing_status["is_processing"]
+        assert status["status"] == web.processing_status["status"]
+
+    def test_stream_pushes_changes(self, client):
+        """Test a status change wakes the stream and sends only the new line."""
+        import json
+
+        response = client.get("/api/status/stream", buffered=False)
+        try:
+            next(response.response)
+            web.add_log("pushed")
+            event = next(response.response).decode()
+        finally:
+            response.close()
+
+        status = json.loads(event[len("data: "):])
+        assert len(status["log_new"]) == 1
+        assert status["log_new"][0].endswith("pushed")
+
+    def test_idle_stream_sends_heartbeat(self, client, monkeypatch):
+        """Test an idle stream sends an SSE comment rather than staying silent."""
+        monkeypatch.setattr(web, "STATUS_HEARTBEAT_SECONDS", 0.01)
+
+        response = client.get("/api/status/stream", buffered=False)
+        try:
+            next(response.response)
+            event = next(response.response)
+        finally:
+            response.close()
+
+        assert event == b": keepalive\n\n"
+
+
+class TestStatusUpdateQueue:
+    """Tests for processor updates applied off the processing thread."""
+
+    def test_queued_updates_applied_in_order(self):
+        """Test flushing applies every queued progress and status update."""
+        web.clear_log()
+        web.start_status_drain()
+
+        web._status_updates.put(("progress", 40))
+        web._status_updates.put(("status", "Finding duplicates..."))
+        web._status_updates.put(("progress", 150))
+        web.flush_status_updates()
+
+        assert web.processing_status["progress"] == 100
+        assert web.processing_status["status"] == "Finding duplicates..."
+        assert web.processing_status["log"][-1].endswith("Finding duplicates...")
+
+    def test_progress_object_converted_to_percent(self):
+        """Test a ProcessingProgress-style report becomes a plain percentage."""
+        class Progress:
+            def percent_complete(self):
+                return 42.5
+
+        assert web.progress_percent(Progress()) == 42.5
+        assert web.progress_percent(10) == 10
+
+
+class TestStatusLogDeltas:
+    """Tests for the incremental log protocol on /api/status."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_log(self):
+        """Start each test with an empty log."""
+        web.clear_log()
+
+    def test_since_returns_only_new_lines(self, client):
+        """Test lines at or before ?since are not resent."""
+        web.add_log("first")
+        seq = client.get("/api/status").get_json()["log_seq"]
+        web.add_log("second")
+
+        status = client.get(f"/api/status?since={seq}").get_json()
+
+        assert len(status["log_new"]) == 1
+        assert status["log_new"][0].endswith("second")
+        assert status["log_from"] == seq
+        assert status["log_seq"] == seq + 1
+
+    def test_clear_log_moves_log_start(self, client):
+        """Test starting a new run is visible to clients via log_start."""
+        web.add_log("old run")
+        before = client.get("/api/status").get_json()
+
+        web.clear_log()
+        after = client.get(f"/api/status?since={before['log_seq']}").get_json()
+
+        assert after["log_start"] == before["log_seq"]
+        assert after["log_new"] == []
+
+    def test_log_bounded(self, client):
+        """Test only the most recent LOG_MAX_LINES lines are kept."""
+        for i in range(web.LOG_MAX_LINES + 10):
+            web.add_log(f"line {i}")
+
+        status = client.get("/api/status").get_json()
+
+        assert len(status["log_new"]) == web.LOG_MAX_LINES
+        assert status["log_new"][-1].endswith(f"line {web.LOG_MAX_LINES + 9}")
+        assert status["log_from"] == status["log_seq"] - web.LOG_MAX_LINES
+
+    def test_lines_stamped_with_wall_clock(self, client, monkeypatch):
+        """Test each line carries an HH:MM:SS stamp that follows the clock."""
+        import time
+
+        now = [time.mktime((2024, 5, 1, 9, 30, 15, 0, 0, -1))]
+        monkeypatch.setattr(web.time, "time", lambda: now[0])
+        web.add_log("first")
+        now[0] += 1
+        web.add_log("second")
+
+        lines = client.get("/api/status").get_json()["log_new"]
+
+        assert lines == ["[09:30:15] first", "[09:30:16] second"]
+
+
+class TestBootstrapData:
+    """Tests for the settings inlined into the home page."""
+
+    def test_index_inlines_base_path(self, client, temp_dir):
+        """Test the configured base path is embedded as window.__BOOT__."""
+        import json
+
+        web.save_settings({"base_path": str(temp_dir), "exiftool_path": "exiftool"})
+        response = client.get("/")
+
+        assert b"window.__BOOT__ = " in response.data
+        assert json.dumps(str(temp_dir)).encode() in response.data
+
+    def test_index_etag_changes_with_settings(self, client, temp_dir):
+        """Test the cached page is rebuilt when settings change."""
+        web.save_settings({"base_path": str(temp_dir / "a")})
+        first = client.get("/").headers["ETag"]
+        web.save_settings({"base_path": str(temp_dir / "b")})
+        second = client.get("/").headers["ETag"]
+
+        assert first != second
+
+    def test_boot_json_cannot_close_script(self, client, temp_dir):
+        """Test a base path containing </script> cannot break out of the tag."""
+        web.save_settings({"base_path": "</script><b>"})
+        response = client.get("/")
+
+        assert b"</script><b>" not in response.data
+
+
+class TestSettingsCache:
+    """Tests for the in-process settings cache."""
+
+    def test_returns_independent_copies(self, client, temp_dir):
+        """Test mutating a loaded dict does not leak into the cache."""
+        web.save_settings({"base_path": str(temp_dir)})
+
+        web.load_settings()["base_path"] = "changed"
+
+        assert web.load_settings()["base_path"] == str(temp_dir)
+
+    def test_saved_file_is_readable_json(self, client, temp_dir):
+        """Test config.json stays indented JSON that round-trips non-ASCII paths."""
+        import json
+
+        web.save_settings({"base_path": "C:/Fotos/Café"})
+        text = (temp_dir / "config.json").read_text(encoding="utf-8")
+
+        assert json.loads(text) == {"base_path": "C:/Fotos/Café"}
+        assert '\n  "base_path"' in text
+
+    def test_save_replaces_file_atomically(self, client, temp_dir, monkeypatch):
+        """Test a failed write keeps the old config and leaves no temp file."""
+        web.save_settings({"base_path": "old"})
+
+        def fail(obj, indent=False):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(web, "json_bytes", fail)
+
+        assert web.save_settings({"base_path": "new"}) is False
+        assert web.load_settings()["base_path"] == "old"
+        assert sorted(p.name for p in temp_dir.iterdir() if "config" in p.name) == ["config.json"]
+
+    def test_external_edit_reloaded(self, client, temp_dir):
+        """Test a change to the file on disk is picked up."""
+        import json
+        import os
+
+        config = temp_dir / "config.json"
+        web.save_settings({"base_path": "old"})
+        config.write_text(json.dumps({"base_path": "new path"}))
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert web.load_settings()["base_path"] == "new path"
+
+
+class TestReviewGroups:
+    """Tests for the review groups listing."""
+
+    def test_lists_group_photos(self, client, temp_dir):
+        """Test photos in a review group are listed and the BEST_ copy is picked."""
+        group = temp_dir / "Pics Waiting for Approval" / "NEEDS ATTENTION - Duplicates" / "group_1"
+        group.mkdir(parents=True)
+        for name in ["BEST_a.jpg", "b.JPG", "notes.txt"]:
+            (group / name).write_bytes(b"x")
+        web.save_settings({"base_path": str(temp_dir)})
+
+        response = client.get("/api/review/groups")
+
+        assert response.mimetype == "application/json"
+        data = response.get_json()
+        assert data["total"] == 1
+        assert sorted(data["groups"][0]["photos"]) == ["BEST_a.jpg", "b.JPG"]
+        assert data["groups"][0]["best"] == "BEST_a.jpg"
+        assert data["groups"][0]["category"] == "Duplicates"
+
+    def test_listing_cached_until_folders_change(self, client, temp_dir):
+        """Test the listing is reused until a group is added."""
+        import os
+
+        category = temp_dir / "Pics Waiting for Approval" / "Burst Photos"
+        (category / "burst_1").mkdir(parents=True)
+        (category / "burst_1" / "a.jpg").write_bytes(b"x")
+        web.save_settings({"base_path": str(temp_dir)})
+
+        first = client.get("/api/review/groups").data
+        assert client.get("/api/review/groups").data == first
+
+        (category / "burst_2").mkdir()
+        (category / "burst_2" / "b.jpg").write_bytes(b"x")
+        stat = category.stat()  # Coarse mtimes could hide a same-tick change
+        os.utime(category, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert client.get("/api/review/groups").get_json()["total"] == 2
+
+    def test_review_photo_revalidates(self, client, temp_dir):
+        """Test review photos are privately cacheable and answer 304 to a matching ETag."""
+        photo = temp_dir / "a.jpg"
+        photo.write_bytes(b"jpeg bytes")
+        url = "/api/review/photo/" + str(photo).lstrip("/")
+
+        response = client.get(url)
+        assert response.data == b"jpeg bytes"
+        assert response.cache_control.private
+        assert response.cache_control.max_age == web.REVIEW_PHOTO_MAX_AGE
+        response.close()
+
+        response = client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+        assert response.status_code == 304
+        response.close()
+
+    def test_linked_category_folder_listed_once(self, client, temp_dir):
+        """Test a category folder reachable under both names is only scanned once."""
+        review = temp_dir / "Pics Waiting for Approval"
+        group = review / "NEEDS ATTENTION - Duplicates" / "group_1"
+        group.mkdir(parents=True)
+        (group / "a.jpg").write_bytes(b"x")
+        try:
+            (review / "Duplicates").symlink_to(review / "NEEDS ATTENTION - Duplicates")
+        except OSError:
+            pytest.skip("symlinks not supported")
+        web.save_settings({"base_path": str(temp_dir)})
+
+        data = client.get("/api/review/groups").get_json()
+
+        assert data["total"] == 1
+
+
+class TestReviewActions:
+    """Tests for keeping and deleting review groups."""
+
+    @pytest.fixture
+    def group(self, client, temp_dir):
+        """A duplicates group holding two photos and a stray text file."""
+        group = temp_dir / "Pics Waiting for Approval" / "NEEDS ATTENTION - Duplicates" / "group_1"
+        group.mkdir(parents=True)
+        for name in ["BEST_a.jpg", "b.PNG", "notes.txt"]:
+            (group / name).write_bytes(b"x")
+        web.save_settings({"base_path": str(temp_dir)})
+        return group
+
+    def _library_files(self, temp_dir):
+        library = temp_dir / "Photos & Videos"
+        return sorted(p.name for p in library.rglob("*") if p.is_file())
+
+    def test_keep_all_moves_photos(self, client, temp_dir, group):
+        """Test keep_all moves every photo into the library and removes the group."""
+        response = client.post("/api/review/action",
+                               json={"action": "keep_all", "group_path": str(group)})
+
+        assert response.get_json()["success"] is True
+        assert self._library_files(temp_dir) == ["a.jpg", "b.PNG"]
+        assert not group.exists()
+
+    def test_keep_one_moves_selected_photo(self, client, temp_dir, group):
+        """Test keep_one keeps only the chosen photo, without the BEST_ prefix."""
+        response = client.post("/api/review/action",
+                               json={"action": "keep_one", "group_path": str(group),
+                                     "photo": "BEST_a.jpg"})
+
+        assert response.get_json()["success"] is True
+        assert self._library_files(temp_dir) == ["a.jpg"]
+        assert not group.exists()
+
+    def test_keep_all_renames_conflicts(self, client, temp_dir, group):
+        """Test photos that would overwrite an existing name get a numbered suffix."""
+        (group / "a.jpg").write_bytes(b"y")
+
+        client.post("/api/review/action",
+                    json={"action": "keep_all", "group_path": str(group)})
+
+        assert self._library_files(temp_dir) == ["a.jpg", "a_1.jpg", "b.PNG"]
+
+    def test_delete_all_removes_group(self, client, group):
+        """Test delete_all hides the group at once and deletes it in the background."""
+        response = client.post("/api/review/action",
+                               json={"action": "delete_all", "group_path": str(group)})
+
+        assert response.get_json()["success"] is True
+        assert not group.exists()
+        assert client.get("/api/review/groups").get_json()["total"] == 0
+
+    def test_remove_tree_later_leaves_nothing(self, group):
+        """Test the renamed folder is gone once the background delete finishes."""
+        web.remove_tree_later(group).result(timeout=10)
+
+        assert list(group.parent.iterdir()) == []
+
+    def test_strip_best_prefix_only_leading(self):
+        """Test only a leading BEST_ marker is removed from the kept name."""
+        assert web.strip_best_prefix("BEST_a.jpg") == "a.jpg"
+        assert web.strip_best_prefix("MY_BEST_a.jpg") == "MY_BEST_a.jpg"
+
+    def test_unique_name_counts_up(self):
+        """Test repeated conflicts produce name_1, name_2 rather than name_1_2."""
+        existing = {"a.jpg"}
+
+        assert web.unique_name("a.jpg", existing) == "a_1.jpg"
+        assert web.unique_name("a.jpg", existing) == "a_2.jpg"
+        assert web.unique_name("b.jpg", existing) == "b.jpg"
+
+
+class TestStartProcessing:
+    """Tests for validating a processing request."""
+
+    def test_missing_base_path_rejected(self, client, temp_dir):
+        """Test a base path that no longer exists is reported."""
+        web.save_settings({"base_path": str(temp_dir / "gone")})
+
+        response = client.post("/api/process")
+
+        assert response.status_code == 400
+        assert "does not exist" in response.get_json()["error"]
+
+    def test_file_base_path_rejected(self, client, temp_dir):
+        """Test a base path that is a file is reported before starting."""
+        (temp_dir / "file.txt").write_text("x")
+        web.save_settings({"base_path": str(temp_dir / "file.txt")})
+
+        response = client.post("/api/process")
+
+        assert response.status_code == 400
+        assert "not a directory" in response.get_json()["error"]
+
+    def test_path_under_file_rejected(self, client, temp_dir):
+        """Test a base path that cannot be reached is reported rather than failing the request."""
+        (temp_dir / "file.txt").write_text("x")
+        web.save_settings({"base_path": str(temp_dir / "file.txt" / "sub")})
+
+        response = client.post("/api/process")
+
+        assert response.status_code == 400
+        assert "does not exist or is not accessible" in response.get_json()["error"]
+
+    def test_second_request_joins_running_job(self, client, temp_dir, monkeypatch):
+        """Test a start request during a run joins it instead of starting another."""
+        import threading
+
+        release = threading.Event()
+        runs = []
+
+        def fake_job(*args):
+            runs.append(args)
+            release.wait(5)
+
+        monkeypatch.setattr(web, "run_processing", fake_job)
+        monkeypatch.setattr(web, "demo_processing", fake_job)
+        monkeypatch.setattr(web, "_process_future", None)
+        monkeypatch.setitem(web.processing_status, "is_processing", False)
+        web.save_settings({"base_path": str(temp_dir)})
+
+        try:
+            first = client.post("/api/process").get_json()
+            second = client.post("/api/process").get_json()
+        finally:
+            release.set()
+        web._process_future.result(timeout=5)
+
+        assert first["success"] is True
+        assert second["joined"] is True
+        assert len(runs) == 1
+
+    def test_marked_processing_before_reply(self, client, temp_dir, monkeypatch):
+        """Test the run shows as processing as soon as the start request returns."""
+        monkeypatch.setattr(web, "run_processing", lambda *args: None)
+        monkeypatch.setattr(web, "demo_processing", lambda *args: None)
+        monkeypatch.setattr(web, "_process_future", None)
+        monkeypatch.setitem(web.processing_status, "is_processing", False)
+        web.save_settings({"base_path": str(temp_dir)})
+
+        client.post("/api/process")
+
+        assert client.get("/api/status").get_json()["is_processing"] is True
+
+    def test_status_drain_started_before_job(self, client, temp_dir, monkeypatch):
+        """Test the drain thread is started by the request, not by the lowered-priority job."""
+        calls = []
+        monkeypatch.setattr(web, "HAS_PROCESSOR", True)
+        monkeypatch.setattr(web, "start_status_drain", lambda: calls.append("drain"))
+        monkeypatch.setattr(web, "run_processing", lambda *args: calls.append("job"))
+        monkeypatch.setattr(web, "_process_future", None)
+        monkeypatch.setitem(web.processing_status, "is_processing", False)
+        web.save_settings({"base_path": str(temp_dir)})
+
+        client.post("/api/process")
+        web._process_future.result(timeout=5)
+
+        assert calls == ["drain", "job"]
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="per-thread nice is Linux-only")
+    def test_worker_priority_lowered_for_its_thread_only(self):
+        """Test lower_thread_priority renices the calling thread, not the server."""
+        import os
+        import threading
+
+        seen = {}
+
+        def job():
+            tid = threading.get_native_id()
+            before = os.getpriority(os.PRIO_PROCESS, tid)
+            web.lower_thread_priority()
+            seen["delta"] = os.getpriority(os.PRIO_PROCESS, tid) - before
+
+        main_before = os.getpriority(os.PRIO_PROCESS, threading.get_native_id())
+        worker = threading.Thread(target=job)
+        worker.start()
+        worker.join()
+
+        assert seen["delta"] > 0
+        assert os.getpriority(os.PRIO_PROCESS, threading.get_native_id()) == main_before
+
+
+class TestOpenLibrary:
+    """Tests for opening the library folder."""
+
+    def test_missing_library_reported(self, client, temp_dir):
+        """Test a library that hasn't been created yet returns 404."""
+        web.save_settings({"base_path": str(temp_dir)})
+
+        response = client.post("/api/open-library")
+
+        assert response.status_code == 404
+        assert "Run processing first" in response.get_json()["message"]
+
+
+class TestBatch:
+    """Tests for combining API calls with /api/batch."""
+
+    def test_runs_each_subrequest(self, client):
+        """Test allowed sub-requests are answered in one response, keyed by id."""
+        response = client.post("/api/batch", json={"requests": [
+            {"id": "settings", "url": "/api/settings", "method": "GET"},
+            {"id": "status", "url": "/api/status?since=0", "method": "GET"},
+        ]})
+
+        data = response.get_json()
+        assert data["settings"] == {"status": 200, "body": web.DEFAULT_SETTINGS}
+        assert data["status"]["body"]["status"] == web.processing_status["status"]
+
+    def test_unlisted_url_refused(self, client):
+        """Test sub-requests outside the whitelist are not dispatched."""
+        response = client.post("/api/batch", json={"requests": [
+            {"id": "x", "url": "/api/open-library", "method": "POST"},
+        ]})
+
+        assert response.get_json()["x"]["status"] == 404
+
+    def test_subrequest_without_body_rejected(self, client):
+        """Test a review action sent with no body is a 400 for that item, not a server error."""
+        response = client.post("/api/batch", json={"requests": [
+            {"id": "act", "url": "/api/review/action", "method": "POST"},
+        ]})
+
+        assert response.get_json()["act"] == {
+            "status": 400, "body": {"success": False, "message": "No data provided"}}
+
+    def test_batch_size_capped(self, client):
+        """Test oversized batches are rejected outright."""
+        requests = [{"url": "/api/status"}] * (web.BATCH_MAX_REQUESTS + 1)
+
+        response = client.post("/api/batch", json={"requests": requests})
+
+        assert response.status_code == 400
+
+
+class TestJsonResponses:
+    """Tests for the JSON API responses."""
+
+    def test_settings_returned_as_json(self, client):
+        """Test /api/settings returns the default settings as JSON."""
+        response = client.get("/api/settings")
+
+        assert response.mimetype == "application/json"
+        assert response.get_json() == web.DEFAULT_SETTINGS
+
+    def test_settings_not_modified(self, client):
+        """Test a matching If-None-Match on /api/settings returns 304."""
+        etag = client.get("/api/settings").headers["ETag"]
+
+        response = client.get("/api/settings", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_unchanged_settings_not_rewritten(self, client, temp_dir):
+        """Test posting the current settings skips the file write."""
+        web.save_settings({"base_path": str(temp_dir)})
+        mtime = (temp_dir / "config.json").stat().st_mtime_ns
+
+        response = client.post("/api/settings", json={"base_path": str(temp_dir)})
+
+        assert response.get_json() == {"success": True, "unchanged": True}
+        assert (temp_dir / "config.json").stat().st_mtime_ns == mtime
+
+    def test_stdlib_fallback_without_orjson(self, monkeypatch):
+        """Test responses still serialize when orjson is unavailable."""
+        monkeypatch.setattr(web, "HAS_ORJSON", False)
+
+        assert web.json_bytes({"path": "café"}) == '{"path": "café"}'.encode("utf-8")
+
+    def test_settings_posted_as_json(self, client, temp_dir):
+        """Test a JSON request body is parsed and the settings saved."""
+        response = client.post("/api/settings", json={"base_path": str(temp_dir)})
+
+        assert response.get_json() == {"success": True}
+        assert web.load_settings()["base_path"] == str(temp_dir)
+
+    def test_orjson_provider_round_trip(self):
+        """Test the orjson provider matches the standard JSON output."""
+        pytest.importorskip("orjson")
+        provider = web.OrjsonProvider(web.app)
+        data = {"b": [1, 2.5, None], "a": "café"}
+
+        assert provider.loads(provider.dumps(data)) == data
+        assert provider.dumps(data, sort_keys=True).startswith('{"a"')